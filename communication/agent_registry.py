@@ -120,6 +120,27 @@ class AgentRegistry:
             logger.error(f"Failed to register agent {entry.agent_id}: {e}")
             return False
     
+    async def register_agents(self, entries: List[RegistryEntry]) -> bool:
+        """Register several agents with a single registry write"""
+        if not entries:
+            return True
+        
+        try:
+            now = datetime.utcnow()
+            mapping = {}
+            for entry in entries:
+                entry.last_heartbeat = now
+                mapping[entry.agent_id] = json.dumps(entry.to_dict())
+            
+            await self.redis.hset(self.registry_key, mapping=mapping)
+            
+            logger.info(f"Registered {len(entries)} agents")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to register {len(entries)} agents: {e}")
+            return False
+    
     async def unregister_agent(self, agent_id: str) -> bool:
         """Unregister an agent from the registry"""
         try:
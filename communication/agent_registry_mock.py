@@ -92,6 +92,15 @@ class AgentRegistry:
             logger.error(f"Failed to register agent {entry.agent_id}: {e}")
             return False
     
+    async def register_agents(self, entries: List[RegistryEntry]) -> bool:
+        """Register several agents in one update"""
+        now = datetime.utcnow()
+        for entry in entries:
+            entry.last_heartbeat = now
+        self.agents.update((entry.agent_id, entry) for entry in entries)
+        logger.info(f"Registered {len(entries)} agents")
+        return True
+    
     async def get_agent(self, agent_id: str) -> Optional[RegistryEntry]:
         """Get agent information by ID"""
         return self.agents.get(agent_id)
@@ -6,6 +6,7 @@ Manages the lifecycle and coordination of all research projects
 import asyncio
 import json
 import logging
+import time
 from typing import Dict, List, Optional, Set, Any
 from datetime import datetime, timedelta
 import redis.asyncio as redis
@@ -42,6 +43,17 @@ class ResearchOrchestrator:
         self.available_agents: Set[str] = set()
         self.agent_assignments: Dict[str, str] = {}  # agent_id -> project_id
         
+        # Persistence tracking: project_id -> updated_at of last successful save
+        self._last_saved_version: Dict[str, datetime] = {}
+        
+        # Incrementally maintained status counters, kept in sync by _on_project_state_change
+        self._active_count = 0
+        self._status_timestamp = (0.0, "")  # (monotonic time, isoformat)
+        
+        # Bumped on every change to projects, the queue or agent assignments,
+        # so callers can cheaply tell whether derived views are stale
+        self.state_version = 0
+        
         # System state
         self.is_running = False
         self.stats = {
@@ -61,6 +73,8 @@ class ResearchOrchestrator:
             "agent_assigned": [],
             "budget_warning": []
         }
+        # Frozen (handler, is_coroutine) tuples rebuilt on registration for dispatch
+        self._handler_tuples: Dict[str, tuple] = {}
     
     async def initialize(self) -> None:
         """Initialize the orchestrator and connect to Redis"""
@@ -118,6 +132,7 @@ class ResearchOrchestrator:
             max_cost_usd=max_cost_usd,
             expected_duration_hours=expected_duration_hours
         )
+        project.state_listener = self._on_project_state_change
         
         # Add to queue or start immediately
         if len(self.get_active_projects()) < self.max_concurrent_projects:
@@ -128,6 +143,7 @@ class ResearchOrchestrator:
         
         # Store in memory and Redis
         self.active_projects[project.id] = project
+        self.state_version += 1
         await self._save_project(project)
         
         # Update stats
@@ -181,6 +197,7 @@ class ResearchOrchestrator:
         for agent_id in list(remaining)[:2]:  # Assign up to 2 additional agents
             project.assign_agent(agent_id, "collaborator")
             self.agent_assignments[agent_id] = project.id
+        self.state_version += 1
         
         await self._trigger_event("agent_assigned", {"project": project, "agents": project.assigned_agents})
         logger.info(f"Assigned agents {project.assigned_agents} to project {project.id}")
@@ -192,6 +209,7 @@ class ResearchOrchestrator:
             raise ValueError(f"Project {project_id} not found")
         
         project.update_progress(progress, note)
+        self.state_version += 1
         
         # Auto-transition states based on progress
         if progress >= 100.0 and project.state != ResearchState.COMPLETED:
@@ -251,6 +269,16 @@ class ResearchOrchestrator:
         await self._trigger_event("project_failed", project)
         logger.error(f"Failed project: {project.title} - {reason}")
     
+    def _on_project_state_change(self, project: ResearchProject, was_active: bool) -> None:
+        """Account for a project state change, wherever ``update_state`` was called from
+        
+        The workflow engine and safety monitor change project states
+        directly, so the counters are kept by this listener rather than
+        by the orchestrator's own transitions.
+        """
+        self._active_count += int(project.is_active()) - int(was_active)
+        self.state_version += 1
+    
     async def _start_next_queued_project(self) -> None:
         """Start the next project in the queue if capacity allows"""
         if not self.project_queue:
@@ -274,15 +302,20 @@ class ResearchOrchestrator:
         return self.active_projects.get(project_id)
     
     def get_system_status(self) -> Dict[str, Any]:
-        """Get comprehensive system status"""
-        active_projects = self.get_active_projects()
+        """Get comprehensive system status from maintained counters"""
+        # Reuse the formatted timestamp for up to a second under tight polling
+        now = time.monotonic()
+        generated_at, timestamp = self._status_timestamp
+        if now - generated_at >= 1.0:
+            timestamp = datetime.utcnow().isoformat()
+            self._status_timestamp = (now, timestamp)
         
         return {
             "is_running": self.is_running,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": timestamp,
             "projects": {
                 "total": len(self.active_projects),
-                "active": len(active_projects),
+                "active": self._active_count,
                 "queued": len(self.project_queue),
                 "max_concurrent": self.max_concurrent_projects
             },
@@ -305,13 +338,15 @@ class ResearchOrchestrator:
         if event_type not in self.event_handlers:
             self.event_handlers[event_type] = []
         self.event_handlers[event_type].append(handler)
+        self._handler_tuples[event_type] = tuple(
+            (h, asyncio.iscoroutinefunction(h)) for h in self.event_handlers[event_type]
+        )
     
     async def _trigger_event(self, event_type: str, data: Any) -> None:
         """Trigger all handlers for a specific event type"""
-        handlers = self.event_handlers.get(event_type, [])
-        for handler in handlers:
+        for handler, is_coroutine in self._handler_tuples.get(event_type, ()):
             try:
-                if asyncio.iscoroutinefunction(handler):
+                if is_coroutine:
                     await handler(data)
                 else:
                     handler(data)
@@ -323,12 +358,17 @@ class ResearchOrchestrator:
         if not self.redis:
             return
         
+        # Skip serialization and the Redis round-trip for unchanged projects
+        if self._last_saved_version.get(project.id) == project.updated_at:
+            return
+        
         try:
             await self.redis.set(
                 f"project:{project.id}",
                 json.dumps(project.to_dict()),
                 ex=86400 * 30  # Expire after 30 days
             )
+            self._last_saved_version[project.id] = project.updated_at
         except Exception as e:
             logger.error(f"Failed to save project {project.id}: {e}")
     
@@ -349,8 +389,12 @@ class ResearchOrchestrator:
                 if data:
                     project_dict = json.loads(data)
                     project = ResearchProject.from_dict(project_dict)
+                    project.state_listener = self._on_project_state_change
                     self.active_projects[project.id] = project
+                    self._last_saved_version[project.id] = project.updated_at
             
+            self._active_count = len(self.get_active_projects())
+            self.state_version += 1
             logger.info(f"Loaded {len(self.active_projects)} projects from storage")
             
         except Exception as e:
@@ -5,7 +5,7 @@ Manages the state and lifecycle of autonomous research projects
 
 from enum import Enum
 from dataclasses import dataclass, field
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Callable
 import uuid
 from datetime import datetime
 import json
@@ -82,9 +82,15 @@ class ResearchProject:
     metadata: Dict[str, Any] = field(default_factory=dict)
     logs: List[Dict[str, Any]] = field(default_factory=list)
     
+    # Called as listener(project, was_active) after every state change; not serialized
+    state_listener: Optional[Callable[['ResearchProject', bool], None]] = field(
+        default=None, repr=False, compare=False
+    )
+    
     def update_state(self, new_state: ResearchState, note: str = "") -> None:
         """Update project state with automatic timestamp tracking"""
         old_state = self.state
+        was_active = self.is_active()
         self.state = new_state
         self.updated_at = datetime.utcnow()
         
@@ -103,11 +109,16 @@ class ResearchProject:
                 "note": note
             }
         )
+        
+        if self.state_listener:
+            self.state_listener(self, was_active)
     
     def add_log(self, event_type: str, data: Dict[str, Any]) -> None:
         """Add a timestamped log entry"""
+        # Every mutation logs, so this also marks the project as changed
+        self.updated_at = datetime.utcnow()
         log_entry = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": self.updated_at.isoformat(),
             "event_type": event_type,
             "data": data
         }
@@ -0,0 +1,90 @@
+"""
+Broadcast Relay - shares WebSocket broadcasts between dashboard workers over Redis pub/sub
+"""
+
+import asyncio
+import logging
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
+import redis.asyncio as redis
+
+
+logger = logging.getLogger(__name__)
+
+
+class RedisBroadcastRelay:
+    """Relay batched broadcasts between uvicorn worker processes
+
+    With several workers each process only holds the WebSocket clients
+    connected to it. Every drained batch is published once to a Redis
+    channel; the other workers fan it out to their own clients, so a
+    broadcast costs each process O(local clients) rather than one process
+    O(all clients).
+    """
+
+    CHANNEL = "dashboard:broadcast"
+
+    # Topics every worker produces for itself, which are never relayed
+    LOCAL_TOPICS = frozenset({"metrics"})
+
+    def __init__(self, redis_url: str = "redis://localhost:6379"):
+        self.redis_url = redis_url
+        self.worker_id = uuid.uuid4().hex
+        self.redis: Optional[redis.Redis] = None
+        self._listen_task: Optional[asyncio.Task] = None
+
+    async def start(self, websocket_manager):
+        """Connect to Redis and deliver batches from other workers to ``websocket_manager``"""
+        self.redis = redis.from_url(self.redis_url)
+        await self.redis.ping()
+
+        pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(self.CHANNEL)
+        self._listen_task = asyncio.create_task(self._listen(pubsub, websocket_manager))
+        logger.info("Broadcast relay started for worker %s", self.worker_id)
+
+    async def stop(self):
+        """Stop relaying and close the Redis connection"""
+        if self._listen_task:
+            self._listen_task.cancel()
+            try:
+                await self._listen_task
+            except asyncio.CancelledError:
+                pass
+            self._listen_task = None
+
+        if self.redis:
+            await self.redis.aclose()
+            self.redis = None
+
+    async def publish(self, batch: List[Tuple[Tuple[str, ...], Dict[str, Any]]]):
+        """Publish the shareable part of a drained batch to the other workers"""
+        shared = [
+            (topics, message) for topics, message in batch
+            if not topics or not self.LOCAL_TOPICS.issuperset(topics)
+        ]
+        if not shared or self.redis is None:
+            return
+
+        try:
+            frame = orjson.dumps({"origin": self.worker_id, "batch": shared}, default=str)
+            await self.redis.publish(self.CHANNEL, frame)
+        except Exception as e:
+            logger.error("Error publishing broadcast batch: %s", e)
+
+    async def _listen(self, pubsub, websocket_manager):
+        """Hand batches published by other workers to the local manager"""
+        try:
+            async for item in pubsub.listen():
+                try:
+                    envelope = orjson.loads(item["data"])
+                    if envelope["origin"] == self.worker_id:
+                        continue
+                    batch = [(tuple(topics), message) for topics, message in envelope["batch"]]
+                    await websocket_manager.deliver_batch(batch)
+                except Exception as e:
+                    logger.error("Error relaying broadcast batch: %s", e)
+        finally:
+            await pubsub.aclose()
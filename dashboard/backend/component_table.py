@@ -0,0 +1,106 @@
+"""
+Component Status Table - struct-of-arrays storage for dashboard component health
+"""
+
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, List, Any
+
+from dashboard.shared.schemas import ComponentStatus
+
+
+# Statuses are stored as small int codes and resolved to enums only at response time
+STATUS_BY_CODE = tuple(ComponentStatus)
+STATUS_CODES = {status: code for code, status in enumerate(STATUS_BY_CODE)}
+
+# Overall health is the max severity across components
+_SEVERITY = {
+    ComponentStatus.HEALTHY: 0,
+    ComponentStatus.WARNING: 1,
+    ComponentStatus.ERROR: 2,
+    ComponentStatus.OFFLINE: 2,
+}
+SEVERITY_BY_CODE = tuple(_SEVERITY[status] for status in STATUS_BY_CODE)
+HEALTH_BY_SEVERITY = (ComponentStatus.HEALTHY, ComponentStatus.WARNING, ComponentStatus.ERROR)
+
+
+@dataclass(slots=True)
+class ComponentTable:
+    """Parallel per-component arrays, indexed by the slot assigned on add()"""
+
+    names: List[str] = field(default_factory=list)
+    statuses: List[int] = field(default_factory=list)
+    heartbeats: array = field(default_factory=lambda: array('d'))  # time.monotonic() values
+    error_counts: array = field(default_factory=lambda: array('i'))
+    perf_scores: array = field(default_factory=lambda: array('f'))
+    _index: Dict[str, int] = field(default_factory=dict)
+    version: int = 0  # bumped whenever a field in to_payload() changes
+    # Components per severity level, maintained on writes so health is O(1) to read
+    severity_counts: List[int] = field(default_factory=lambda: [0] * len(HEALTH_BY_SEVERITY))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def add(
+        self,
+        name: str,
+        status: ComponentStatus = ComponentStatus.HEALTHY,
+        heartbeat: float = 0.0,
+        error_count: int = 0,
+        performance_score: float = 100.0
+    ) -> int:
+        """Register a component (or reset an existing one) and return its slot"""
+        self.version += 1
+        slot = self._index.get(name)
+        if slot is not None:
+            self._set_code(slot, STATUS_CODES[status])
+            self.heartbeats[slot] = heartbeat
+            self.error_counts[slot] = error_count
+            self.perf_scores[slot] = performance_score
+            return slot
+
+        slot = len(self.names)
+        self._index[name] = slot
+        self.names.append(name)
+        self.statuses.append(STATUS_CODES[status])
+        self.severity_counts[SEVERITY_BY_CODE[STATUS_CODES[status]]] += 1
+        self.heartbeats.append(heartbeat)
+        self.error_counts.append(error_count)
+        self.perf_scores.append(performance_score)
+        return slot
+
+    def set_status(self, name: str, status: ComponentStatus):
+        """Update a single component's status"""
+        self._set_code(self._index[name], STATUS_CODES[status])
+        self.version += 1
+
+    def _set_code(self, slot: int, code: int):
+        """Store a status code, keeping the severity counts in step"""
+        self.severity_counts[SEVERITY_BY_CODE[self.statuses[slot]]] -= 1
+        self.severity_counts[SEVERITY_BY_CODE[code]] += 1
+        self.statuses[slot] = code
+
+    @property
+    def overall_health(self) -> ComponentStatus:
+        """Health of the worst component (healthy when there are none)"""
+        for severity in range(len(self.severity_counts) - 1, 0, -1):
+            if self.severity_counts[severity]:
+                return HEALTH_BY_SEVERITY[severity]
+        return HEALTH_BY_SEVERITY[0]
+
+    def touch_all(self, now: float):
+        """Stamp every component's heartbeat in one C-level slice assignment"""
+        self.heartbeats[:] = array('d', [now]) * len(self.names)
+
+    def to_payload(self) -> Dict[str, Dict[str, Any]]:
+        """Render the table as plain dicts for event payloads"""
+        return {
+            name: {
+                "status": STATUS_BY_CODE[code].value,
+                "error_count": errors,
+                "performance_score": score
+            }
+            for name, code, errors, score in zip(
+                self.names, self.statuses, self.error_counts, self.perf_scores
+            )
+        }
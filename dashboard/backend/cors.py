@@ -0,0 +1,93 @@
+"""
+CORS Middleware - static-allowlist CORS handling for the dashboard API
+"""
+
+from typing import Iterable, List, Tuple
+
+
+class StaticCORSMiddleware:
+    """Pure ASGI CORS middleware for a small, fixed set of origins
+
+    Origins are matched as raw header bytes against a frozenset and every
+    response header is prebuilt, so no per-request allow-lists are
+    constructed. Preflight requests are answered directly with 204.
+    Credentials are allowed, so the matching origin is echoed back rather
+    than ``*``.
+    """
+
+    METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+    MAX_AGE = b"600"
+
+    def __init__(self, app, allow_origins: Iterable[str]):
+        self.app = app
+        self.allowed_origins = frozenset(origin.encode("latin-1") for origin in allow_origins)
+
+        # Headers shared by every allowed response; the origin is appended per request
+        self._simple_headers: List[Tuple[bytes, bytes]] = [
+            (b"access-control-allow-credentials", b"true"),
+            (b"vary", b"Origin"),
+        ]
+        self._preflight_headers: List[Tuple[bytes, bytes]] = [
+            (b"access-control-allow-methods", self.METHODS),
+            (b"access-control-max-age", self.MAX_AGE),
+            (b"access-control-allow-credentials", b"true"),
+            (b"vary", b"Origin"),
+            (b"content-length", b"0"),
+        ]
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        request_method = None
+        request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        allowed = origin in self.allowed_origins
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self._preflight(send, origin if allowed else None, request_headers)
+            return
+
+        if not allowed:
+            await self.app(scope, receive, send)
+            return
+
+        extra_headers = self._simple_headers + [(b"access-control-allow-origin", origin)]
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", ())) + extra_headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    async def _preflight(self, send, origin, request_headers):
+        """Answer a CORS preflight without touching the application"""
+        if origin is None:
+            await send({
+                "type": "http.response.start",
+                "status": 400,
+                "headers": [(b"content-type", b"text/plain; charset=utf-8")],
+            })
+            await send({"type": "http.response.body", "body": b"Disallowed CORS origin"})
+            return
+
+        headers = self._preflight_headers + [(b"access-control-allow-origin", origin)]
+        if request_headers is not None:
+            headers.append((b"access-control-allow-headers", request_headers))
+
+        await send({"type": "http.response.start", "status": 204, "headers": headers})
+        await send({"type": "http.response.body", "body": b""})
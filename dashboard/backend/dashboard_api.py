@@ -4,15 +4,21 @@ Dashboard API - FastAPI endpoints for web dashboard
 
 import asyncio
 import logging
+import os
+import sys
+import time
+import uuid
 from datetime import datetime, timedelta
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, Any, List, Optional
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends, WebSocket, WebSocketDisconnect
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 
 # Import Phase 4 components
 from core.orchestrator import ResearchOrchestrator
-from core.research_project import ResearchProject, Priority
+from core.research_project import ResearchProject, ResearchState, Priority
 from workflow.workflow_engine import WorkflowEngine
 from workflow.task_scheduler import TaskScheduler
 from safety.oversight_monitor import SafetyMonitor
@@ -23,28 +29,41 @@ from communication.message_bus_mock import MessageBus
 
 # Import dashboard-specific modules
 from dashboard.shared.schemas import (
-    SystemOverview, ComponentInfo, PerformanceMetrics, ComponentStatus,
+    SystemOverview, ComponentStatus,
     WorkflowStartRequest, TestExecutionRequest, ApiResponse
 )
-from dashboard.shared.events import EventType, create_system_status_event
+from dashboard.shared.events import EventType, WorkflowProgressData, create_system_status_event
 from dashboard.backend.metrics_collector import SystemMetricsCollector
 from dashboard.backend.websocket_handler import WebSocketManager
+from dashboard.backend.broadcast_relay import RedisBroadcastRelay
 from dashboard.backend.test_runner import DashboardTestRunner
+from dashboard.backend.dashboard_state import DashboardState, get_dashboard_state
+from dashboard.backend.cors import StaticCORSMiddleware
+from dashboard.backend.etag import StateETagMiddleware
+from dashboard.backend.component_table import STATUS_BY_CODE
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Global instances
-orchestrator: Optional[ResearchOrchestrator] = None
-websocket_manager: Optional[WebSocketManager] = None
-metrics_collector: Optional[SystemMetricsCollector] = None
-test_runner: Optional[DashboardTestRunner] = None
-
-# Component status tracking
-component_statuses = {}
-active_workflows = {}
-system_metrics = {}
+# Adaptive metrics cadence: broadcast only meaningful changes, back off when idle
+METRICS_BASE_INTERVAL = 5.0
+METRICS_MAX_INTERVAL = 30.0
+METRIC_CHANGE_THRESHOLDS = {
+    "cpu_usage": 2.0,
+    "memory_usage": 1.0,
+    "disk_usage": 0.5,
+    "load_1min": 0.25,
+    "process_count": 5,
+    "active_tasks": 1,
+    "queue_length": 1,
+    "response_time": 10.0,
+    "total_agents": 1,
+    "error_count": 1,
+}
+
+# Overview responses are reused for this long to absorb frontend polling
+OVERVIEW_CACHE_TTL = 1.0
 
 
 @asynccontextmanager
@@ -52,16 +71,31 @@ async def lifespan(app: FastAPI):
     """Application lifespan events"""
     # Startup
     logger.info("Starting Dashboard API...")
-    await initialize_dashboard_components()
+    
+    # Tasks that finish without suspending skip the event-loop round trip (3.12+)
+    if sys.version_info >= (3, 12):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    
+    state = DashboardState()
+    app.state.dashboard = state
+    await initialize_dashboard_components(state)
     
     # Start background tasks
-    asyncio.create_task(periodic_metrics_collection())
+    metrics_task = asyncio.create_task(periodic_metrics_collection(state))
     
     yield
     
     # Shutdown
     logger.info("Shutting down Dashboard API...")
-    await cleanup_dashboard_components()
+    
+    # Stop ticking before the collector closes its executor and /proc files
+    metrics_task.cancel()
+    try:
+        await metrics_task
+    except asyncio.CancelledError:
+        pass
+    
+    await cleanup_dashboard_components(state)
 
 
 # Create FastAPI app
@@ -69,32 +103,45 @@ app = FastAPI(
     title="Science Research Institute Dashboard API",
     description="Real-time monitoring and control dashboard for autonomous research system",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
+)
+
+# Polled endpoints answer unchanged requests with 304 Not Modified
+app.add_middleware(
+    StateETagMiddleware,
+    paths=["/api/dashboard/overview", "/api/dashboard/workflows", "/api/dashboard/agents"]
 )
 
-# Add CORS middleware
+# Add CORS middleware (outermost, so 304s also carry CORS headers)
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["http://localhost:3000", "http://127.0.0.1:3000"],  # React dev server
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    StaticCORSMiddleware,
+    allow_origins=["http://localhost:3000", "http://127.0.0.1:3000"]  # React dev server
 )
 
 
-async def initialize_dashboard_components():
+async def initialize_dashboard_components(state: DashboardState):
     """Initialize dashboard components and Phase 4 integration"""
-    global orchestrator, websocket_manager, metrics_collector, test_runner
-    
     try:
         # Initialize WebSocket manager
-        websocket_manager = WebSocketManager()
+        state.websocket_manager = WebSocketManager()
+        await state.websocket_manager.start()
+        
+        # With several workers, share broadcasts so every client sees every event
+        if int(os.getenv("UVICORN_WORKERS", "1")) > 1:
+            relay = RedisBroadcastRelay("redis://localhost:6379")
+            try:
+                await relay.start(state.websocket_manager)
+                state.websocket_manager.relay = relay
+            except Exception as e:
+                logger.warning("Broadcast relay unavailable, broadcasts stay worker-local: %s", e)
+                await relay.stop()
         
         # Initialize metrics collector
-        metrics_collector = SystemMetricsCollector()
+        state.metrics_collector = SystemMetricsCollector()
         
         # Initialize test runner
-        test_runner = DashboardTestRunner(websocket_manager)
+        state.test_runner = DashboardTestRunner(state.websocket_manager)
         
         # Initialize Phase 4 components with mock implementations
         agent_registry = AgentRegistry()
@@ -107,75 +154,214 @@ async def initialize_dashboard_components():
         e2e_testing = E2ETestRunner()
         
         # Initialize the real orchestrator
-        orchestrator = ResearchOrchestrator(
+        state.orchestrator = ResearchOrchestrator(
             redis_url="redis://localhost:6379",
             max_concurrent_projects=3
         )
-        await orchestrator.initialize()
+        await state.orchestrator.initialize()
         
         # Update component statuses
-        component_statuses.update({
-            "task_scheduler": {"status": "healthy", "last_heartbeat": datetime.now()},
-            "safety_monitor": {"status": "healthy", "last_heartbeat": datetime.now()},
-            "quality_system": {"status": "healthy", "last_heartbeat": datetime.now()},
-            "agent_registry": {"status": "healthy", "last_heartbeat": datetime.now()},
-            "message_bus": {"status": "healthy", "last_heartbeat": datetime.now()},
-            "e2e_testing": {"status": "healthy", "last_heartbeat": datetime.now()},
-            "orchestrator": {"status": "healthy", "last_heartbeat": datetime.now()},
-        })
+        now = time.monotonic()
+        for name in (
+            "task_scheduler",
+            "safety_monitor",
+            "quality_system",
+            "agent_registry",
+            "message_bus",
+            "e2e_testing",
+            "orchestrator",
+        ):
+            state.component_table.add(name, ComponentStatus.HEALTHY, heartbeat=now)
         
         logger.info("Dashboard components initialized successfully")
         
     except Exception as e:
-        logger.error(f"Failed to initialize dashboard components: {e}")
+        logger.error("Failed to initialize dashboard components: %s", e)
         # Fall back to mock mode if Redis is not available
         logger.warning("Falling back to mock mode for orchestrator")
-        orchestrator = None
+        state.orchestrator = None
 
 
-async def cleanup_dashboard_components():
+async def cleanup_dashboard_components(state: DashboardState):
     """Cleanup dashboard components"""
-    global websocket_manager, metrics_collector
-    
-    if websocket_manager:
-        await websocket_manager.disconnect_all()
+    if state.websocket_manager:
+        await state.websocket_manager.stop()
+        await state.websocket_manager.disconnect_all()
+        if state.websocket_manager.relay:
+            await state.websocket_manager.relay.stop()
     
-    if metrics_collector:
-        await metrics_collector.stop()
+    if state.metrics_collector:
+        await state.metrics_collector.stop()
+
+
+def _changed_metrics(previous: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the tracked metrics that moved by at least their change threshold"""
+    changed = {}
+    for key, threshold in METRIC_CHANGE_THRESHOLDS.items():
+        if key not in current:
+            continue
+        value = current[key]
+        if key not in previous or abs(value - previous[key]) >= threshold:
+            changed[key] = value
+    return changed
+
+
+def _metrics_snapshot(state: DashboardState) -> Optional[Dict[str, Any]]:
+    """Status event carrying every tracked metric, or None before the first collection"""
+    performance = {
+        key: state.system_metrics[key]
+        for key in METRIC_CHANGE_THRESHOLDS
+        if key in state.system_metrics
+    }
+    if not performance:
+        return None
+    return create_system_status_event(
+        components_status=state.component_table.to_payload(),
+        performance_metrics=performance
+    ).to_dict()
 
 
-async def periodic_metrics_collection():
-    """Collect system metrics periodically"""
-    global metrics_collector, websocket_manager, component_statuses
+async def send_metrics_snapshot(state: DashboardState, client_id: str):
+    """Bring a client that just started receiving metrics up to date
+    
+    Metrics broadcasts only carry values that moved past their threshold,
+    so without a snapshot a late subscriber would never see metrics that
+    stay steady.
+    """
+    websocket_manager = state.websocket_manager
+    if not websocket_manager or not websocket_manager.is_subscribed(client_id, "metrics"):
+        return
+    snapshot = _metrics_snapshot(state)
+    if snapshot is not None:
+        await websocket_manager.send_to_client(client_id, snapshot)
+
+
+async def periodic_metrics_collection(state: DashboardState):
+    """Collect system metrics, broadcasting only when something changed"""
+    interval = METRICS_BASE_INTERVAL
+    last_broadcast_metrics: Dict[str, Any] = {}
+    last_workflow_version = state.workflow_version
+    
+    # Dumped status event, reused as a template while the component table is unchanged
+    status_template: Optional[Dict[str, Any]] = None
+    status_template_version = -1
+    
+    # Ticks are scheduled against fixed deadlines so slow collections don't cause drift
+    loop = asyncio.get_running_loop()
+    next_deadline = loop.time()
     
     while True:
         try:
+            metrics_collector = state.metrics_collector
+            websocket_manager = state.websocket_manager
             if metrics_collector and websocket_manager:
-                # Collect system metrics
+                # Collect system metrics (psutil runs off the event loop)
                 metrics = await metrics_collector.collect_metrics()
-                system_metrics.update(metrics)
-                
-                # Update component heartbeats
-                current_time = datetime.now()
-                for component in component_statuses:
-                    component_statuses[component]["last_heartbeat"] = current_time
+                state.system_metrics.update(metrics)
                 
-                # Create and broadcast system status event
-                event = create_system_status_event(
-                    components_status=component_statuses,
-                    performance_metrics=metrics
-                )
+                # Update component heartbeats in one pass
+                state.component_table.touch_all(time.monotonic())
                 
-                await websocket_manager.broadcast(event.dict())
+                changed = _changed_metrics(last_broadcast_metrics, metrics)
+                if changed:
+                    # Sub-threshold drift keeps the ETag, so polls still get 304;
+                    # workflow and component changes move it on their own
+                    state.mark_changed()
+                if changed or state.workflow_version != last_workflow_version:
+                    last_broadcast_metrics.update(changed)
+                    last_workflow_version = state.workflow_version
+                    
+                    # Performance carries only the metrics that changed since the last
+                    # broadcast; new subscribers get a full snapshot from send_metrics_snapshot
+                    table = state.component_table
+                    if status_template is None or table.version != status_template_version:
+                        status_template = create_system_status_event(
+                            components_status=table.to_payload(),
+                            performance_metrics={}
+                        ).to_dict()
+                        status_template_version = table.version
+                    
+                    # Shallow copy: queued messages must not alias the template
+                    payload = {
+                        **status_template,
+                        "timestamp": datetime.now(),
+                        "data": {
+                            "components": status_template["data"]["components"],
+                            "performance": changed
+                        }
+                    }
+                    websocket_manager.publish("metrics", payload)
+                    interval = METRICS_BASE_INTERVAL
+                else:
+                    # Nothing worth sending: back off towards the maximum interval
+                    interval = min(interval * 2, METRICS_MAX_INTERVAL)
                 
         except Exception as e:
-            logger.error(f"Error in periodic metrics collection: {e}")
+            logger.error("Error in periodic metrics collection: %s", e)
         
-        await asyncio.sleep(5)  # Collect metrics every 5 seconds
+        next_deadline += interval
+        now = loop.time()
+        if next_deadline < now:
+            # Fell behind: skip the missed ticks rather than firing them back to back
+            next_deadline += ((now - next_deadline) // interval + 1) * interval
+        await asyncio.sleep(next_deadline - now)
 
 
 # API Endpoints
 
+def _wants_zlib_payloads(websocket: WebSocket) -> bool:
+    """Whether to zlib-compress large payloads for a client ourselves
+    
+    Clients must opt in with ``compress=1``. A client that offered
+    permessage-deflate has it negotiated (uvicorn enables it), so its
+    frames are already compressed and a second pass would only cost CPU.
+    """
+    if websocket.query_params.get("compress") != "1":
+        return False
+    return "permessage-deflate" not in websocket.headers.get("sec-websocket-extensions", "")
+
+
+@app.websocket("/ws")
+async def dashboard_websocket(websocket: WebSocket):
+    """Real-time event stream
+    
+    Query parameters: ``topics`` is a comma-separated subscription list
+    (e.g. ``workflows,metrics,workflow:<id>``; omit to receive everything)
+    and ``compress=1`` opts in to zlib-compressed large payloads when
+    permessage-deflate is not in use.
+    """
+    await websocket.accept()
+    state = websocket.app.state.dashboard
+    websocket_manager = state.websocket_manager
+    if not websocket_manager:
+        await websocket.close(code=1011)
+        return
+    
+    topics = [t for t in websocket.query_params.get("topics", "").split(",") if t]
+    client_id = uuid.uuid4().hex
+    await websocket_manager.connect_client(client_id, {
+        "websocket": websocket,
+        "topics": topics,
+        "compress": _wants_zlib_payloads(websocket)
+    })
+    await send_metrics_snapshot(state, client_id)
+    
+    try:
+        while True:
+            # Clients may send {"subscribe": [...]} to add topics at runtime
+            message = await websocket.receive_json()
+            topics = message.get("subscribe") if isinstance(message, dict) else None
+            if isinstance(topics, list) and all(isinstance(topic, str) for topic in topics):
+                had_metrics = websocket_manager.is_subscribed(client_id, "metrics")
+                await websocket_manager.subscribe(client_id, topics)
+                if not had_metrics:
+                    await send_metrics_snapshot(state, client_id)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        await websocket_manager.disconnect_client(client_id)
+
+
 @app.get("/")
 async def root():
     """Root endpoint"""
@@ -192,76 +378,97 @@ async def health_check():
     )
 
 
-@app.get("/api/dashboard/overview", response_model=SystemOverview)
-async def get_system_overview():
+# The schema is documented via `responses`; the body is built as plain dicts
+# with SystemOverview's field layout, skipping pydantic on this polled path
+@app.get(
+    "/api/dashboard/overview",
+    response_model=None,
+    responses={200: {"model": SystemOverview}}
+)
+async def get_system_overview(state: DashboardState = Depends(get_dashboard_state)):
     """Get complete system status overview"""
     try:
+        now = time.monotonic()
+        if (
+            state.overview_cache is not None
+            and now - state.overview_generated_at < OVERVIEW_CACHE_TTL
+            and state.overview_table_version == state.component_table.version
+        ):
+            # Reuse the built overview; only the response timestamp is refreshed
+            return ORJSONResponse(content={**state.overview_cache, "timestamp": datetime.now()})
+        
         current_time = datetime.now()
         
-        # Build component info
+        # Build component info; only the heartbeat-derived fields vary per request
         components = {}
-        overall_health = ComponentStatus.HEALTHY
-        
-        for comp_name, comp_data in component_statuses.items():
-            status = ComponentStatus(comp_data.get("status", "offline"))
-            if status in [ComponentStatus.ERROR, ComponentStatus.OFFLINE]:
-                overall_health = ComponentStatus.ERROR
-            elif status == ComponentStatus.WARNING and overall_health == ComponentStatus.HEALTHY:
-                overall_health = ComponentStatus.WARNING
-            
-            components[comp_name] = ComponentInfo(
-                name=comp_name,
-                status=status,
-                uptime_seconds=(current_time - comp_data["last_heartbeat"]).total_seconds(),
-                last_heartbeat=comp_data["last_heartbeat"],
-                error_count=comp_data.get("error_count", 0),
-                performance_score=comp_data.get("performance_score", 100.0)
-            )
+        
+        table = state.component_table
+        for comp_name, code, heartbeat, error_count, score in zip(
+            table.names, table.statuses, table.heartbeats, table.error_counts, table.perf_scores
+        ):
+            # Heartbeats are monotonic floats; convert to datetime only here
+            since_heartbeat = now - heartbeat
+            components[comp_name] = {
+                "name": comp_name,
+                "status": STATUS_BY_CODE[code],
+                "uptime_seconds": since_heartbeat,
+                "last_heartbeat": current_time - timedelta(seconds=since_heartbeat),
+                "error_count": error_count,
+                "performance_score": score
+            }
         
         # Build performance metrics
-        performance = PerformanceMetrics(
-            cpu_usage_percent=system_metrics.get("cpu_usage", 0.0),
-            memory_usage_percent=system_metrics.get("memory_usage", 0.0),
-            disk_usage_percent=system_metrics.get("disk_usage", 0.0),
-            active_tasks=system_metrics.get("active_tasks", 0),
-            queue_length=system_metrics.get("queue_length", 0),
-            response_time_ms=system_metrics.get("response_time", 0.0)
-        )
+        metrics = state.system_metrics
+        performance = {
+            "cpu_usage_percent": metrics.get("cpu_usage", 0.0),
+            "memory_usage_percent": metrics.get("memory_usage", 0.0),
+            "disk_usage_percent": metrics.get("disk_usage", 0.0),
+            "active_tasks": metrics.get("active_tasks", 0),
+            "queue_length": metrics.get("queue_length", 0),
+            "response_time_ms": metrics.get("response_time", 0.0)
+        }
         
-        return SystemOverview(
-            timestamp=current_time,
-            components=components,
-            performance=performance,
-            overall_health=overall_health,
-            active_workflows=len(active_workflows),
-            total_agents=system_metrics.get("total_agents", 0)
-        )
+        overview = {
+            "timestamp": current_time,
+            "components": components,
+            "performance": performance,
+            "overall_health": table.overall_health,
+            "active_workflows": state.active_workflows.live_count(),
+            "total_agents": metrics.get("total_agents", 0)
+        }
+        
+        state.overview_cache = overview
+        state.overview_generated_at = now
+        state.overview_table_version = table.version
+        return ORJSONResponse(content=state.overview_cache)
         
     except Exception as e:
-        logger.error(f"Error getting system overview: {e}")
+        logger.error("Error getting system overview: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/dashboard/workflows")
-async def get_active_workflows():
+async def get_active_workflows(state: DashboardState = Depends(get_dashboard_state)):
     """Get active workflows"""
     try:
         workflows = []
         
-        if orchestrator:
+        if state.orchestrator:
             # Get real workflows from orchestrator
-            active_projects = orchestrator.get_active_projects()
+            active_projects = state.orchestrator.get_active_projects()
             
             for project in active_projects:
+                created_at = project.created_at
+                state_name = project.state.value.lower()
                 workflows.append({
                     "id": project.id,
                     "title": project.title,
-                    "status": project.state.value.lower(),
+                    "status": state_name,
                     "progress": project.progress,
-                    "current_step": project.state.value.lower().replace('_', ' '),
-                    "created_at": project.created_at.isoformat(),
+                    "current_step": state_name.replace('_', ' '),
+                    "created_at": created_at.isoformat(),
                     "updated_at": project.last_updated.isoformat(),
-                    "estimated_completion": (project.created_at + timedelta(hours=project.expected_duration_hours)).isoformat(),
+                    "estimated_completion": (created_at + timedelta(hours=project.expected_duration_hours)).isoformat(),
                     "assigned_agents": list(project.assigned_agents.keys()),
                     "physics_domain": project.physics_domain,
                     "research_question": project.research_question,
@@ -270,45 +477,62 @@ async def get_active_workflows():
                 })
         else:
             # Fallback to local tracking if orchestrator unavailable
-            for cycle_id, workflow_data in active_workflows.items():
-                workflows.append({
+            now = datetime.now()
+            now_iso = now.isoformat()
+            workflows = [
+                {
                     "id": cycle_id,
                     "title": workflow_data.get("project_name", "Unknown"),
                     "status": workflow_data.get("status", "unknown"),
                     "progress": workflow_data.get("progress", 0.0),
                     "current_step": workflow_data.get("current_step", ""),
-                    "created_at": workflow_data.get("start_time", datetime.now()).isoformat(),
-                    "updated_at": datetime.now().isoformat(),
-                    "estimated_completion": workflow_data.get("estimated_completion", datetime.now()).isoformat(),
+                    "created_at": workflow_data.get("start_time", now).isoformat(),
+                    "updated_at": now_iso,
+                    "estimated_completion": workflow_data.get("estimated_completion", now).isoformat(),
                     "assigned_agents": [],
                     "physics_domain": "general",
                     "research_question": "Mock research question",
                     "cost_used": 0.0,
                     "max_cost": 100.0
-                })
+                }
+                for cycle_id, workflow_data in state.active_workflows.live_items()
+            ]
         
         return workflows
         
     except Exception as e:
-        logger.error(f"Error getting workflows: {e}")
+        logger.error("Error getting workflows: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/api/dashboard/workflows/start")
-async def start_workflow(request: WorkflowStartRequest, background_tasks: BackgroundTasks):
+async def start_workflow(
+    request: WorkflowStartRequest,
+    background_tasks: BackgroundTasks,
+    state: DashboardState = Depends(get_dashboard_state)
+):
     """Start a new research workflow"""
     try:
-        if not orchestrator:
+        if not state.orchestrator:
             # Fallback to mock workflow if orchestrator unavailable
-            cycle_id = f"cycle_{int(datetime.now().timestamp())}"
-            active_workflows[cycle_id] = {
+            # Nanosecond IDs keep workflows started in the same second distinct
+            now = datetime.now()
+            cycle_id = f"cycle_{time.time_ns():x}"
+            state.active_workflows.add(cycle_id, {
                 "project_name": request.project_name,
                 "status": "starting",
-                "start_time": datetime.now(),
+                "start_time": now,
                 "progress": 0.0,
                 "current_step": "initialization",
-                "estimated_completion": datetime.now() + timedelta(minutes=10)
-            }
+                "estimated_completion": now + timedelta(minutes=10)
+            })
+            state.mark_workflow_transition()
+            
+            # Simulate the workflow's steps so mock mode shows progress
+            background_tasks.add_task(
+                execute_workflow_background, state, cycle_id, None,
+                request.workflow_template, request.parameters
+            )
             
             return {
                 "success": True,
@@ -317,7 +541,7 @@ async def start_workflow(request: WorkflowStartRequest, background_tasks: Backgr
             }
         
         # Create research project using the real orchestrator
-        project = await orchestrator.create_project(
+        project = await state.orchestrator.create_project(
             title=request.project_name,
             research_question=request.research_topic,
             physics_domain=request.parameters.get("physics_domain", "general"),
@@ -325,18 +549,19 @@ async def start_workflow(request: WorkflowStartRequest, background_tasks: Backgr
             max_cost_usd=float(request.parameters.get("max_cost", 1000.0)),
             expected_duration_hours=int(request.parameters.get("duration_hours", 24))
         )
+        state.mark_workflow_transition()
         
         # Broadcast workflow started event
-        if websocket_manager:
-            await websocket_manager.broadcast({
+        if state.websocket_manager:
+            state.websocket_manager.enqueue({
                 "type": "workflow_started",
                 "data": {
                     "project_id": project.id,
                     "title": project.title,
                     "status": project.state.value.lower()
                 },
-                "timestamp": datetime.now().isoformat()
-            })
+                "timestamp": datetime.now()
+            }, topics=(f"workflow:{project.id}", "workflows"))
         
         return {
             "success": True,
@@ -350,73 +575,92 @@ async def start_workflow(request: WorkflowStartRequest, background_tasks: Backgr
         }
         
     except Exception as e:
-        logger.error(f"Error starting workflow: {e}")
+        logger.error("Error starting workflow: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/api/dashboard/workflows/{project_id}/stop")
-async def stop_workflow(project_id: str):
+async def stop_workflow(project_id: str, state: DashboardState = Depends(get_dashboard_state)):
     """Stop a running workflow"""
     try:
-        if orchestrator:
-            # Try to stop the real project
-            project = orchestrator.get_project(project_id)
-            if not project:
-                raise HTTPException(status_code=404, detail="Project not found")
-            
-            # Fail the project to stop it
-            await orchestrator.fail_project(project_id, "Manually stopped from dashboard")
-            
-            # Broadcast workflow stopped event
-            if websocket_manager:
-                await websocket_manager.broadcast({
-                    "type": "workflow_stopped",
-                    "data": {"project_id": project_id, "title": project.title},
-                    "timestamp": datetime.now().isoformat()
-                })
-            
-            return {
-                "success": True,
-                "message": f"Project {project.title} stopped successfully"
-            }
-        else:
-            # Fallback to local tracking
-            if project_id not in active_workflows:
-                raise HTTPException(status_code=404, detail="Workflow not found")
-            
-            # Update workflow status
-            active_workflows[project_id]["status"] = "stopped"
-            active_workflows[project_id]["completion_time"] = datetime.now()
-            
-            # Broadcast workflow stopped event
-            if websocket_manager:
-                await websocket_manager.broadcast({
-                    "type": "workflow_stopped",
-                    "data": {"cycle_id": project_id},
-                    "timestamp": datetime.now().isoformat()
-                })
-            
-            return {
-                "success": True,
-                "message": f"Mock workflow {project_id} stopped successfully"
-            }
+        async with state.workflow_lock(project_id):
+            if state.orchestrator:
+                # Try to stop the real project
+                project = state.orchestrator.get_project(project_id)
+                if not project:
+                    raise HTTPException(status_code=404, detail="Project not found")
+                
+                # A concurrent stop may already have failed it; don't release its resources twice
+                if project.state == ResearchState.FAILED:
+                    return {
+                        "success": True,
+                        "message": f"Project {project.title} already stopped"
+                    }
+                
+                # Fail the project to stop it
+                await state.orchestrator.fail_project(project_id, "Manually stopped from dashboard")
+                state.mark_workflow_transition()
+                
+                # Broadcast workflow stopped event
+                if state.websocket_manager:
+                    state.websocket_manager.enqueue({
+                        "type": "workflow_stopped",
+                        "data": {"project_id": project_id, "title": project.title},
+                        "timestamp": datetime.now()
+                    }, topics=(f"workflow:{project_id}", "workflows"))
+                
+                return {
+                    "success": True,
+                    "message": f"Project {project.title} stopped successfully"
+                }
+            else:
+                # Fallback to local tracking
+                if project_id not in state.active_workflows:
+                    raise HTTPException(status_code=404, detail="Workflow not found")
+                
+                if state.active_workflows.is_finished(project_id):
+                    return {
+                        "success": True,
+                        "message": f"Mock workflow {project_id} already finished"
+                    }
+                
+                # Update workflow status
+                state.active_workflows.set_status(project_id, "stopped", completion_time=datetime.now())
+                state.mark_workflow_transition()
+                
+                # Broadcast workflow stopped event
+                if state.websocket_manager:
+                    state.websocket_manager.enqueue({
+                        "type": "workflow_stopped",
+                        "data": {"cycle_id": project_id},
+                        "timestamp": datetime.now()
+                    }, topics=(f"workflow:{project_id}", "workflows"))
+                
+                return {
+                    "success": True,
+                    "message": f"Mock workflow {project_id} stopped successfully"
+                }
         
     except Exception as e:
-        logger.error(f"Error stopping workflow: {e}")
+        logger.error("Error stopping workflow: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/api/dashboard/testing/run-suite")
-async def run_test_suite(request: TestExecutionRequest, background_tasks: BackgroundTasks):
+async def run_test_suite(
+    request: TestExecutionRequest,
+    background_tasks: BackgroundTasks,
+    state: DashboardState = Depends(get_dashboard_state)
+):
     """Run E2E test suite"""
     try:
-        if not test_runner:
+        if not state.test_runner:
             raise HTTPException(status_code=503, detail="Test runner not initialized")
         
         # Start test execution in background
-        test_id = f"test_{int(datetime.now().timestamp())}"
+        test_id = f"test_{time.time_ns():x}"
         background_tasks.add_task(
-            test_runner.run_test_suite,
+            state.test_runner.run_test_suite,
             test_id,
             request.test_suite,
             request.test_scenarios,
@@ -430,19 +674,20 @@ async def run_test_suite(request: TestExecutionRequest, background_tasks: Backgr
         )
         
     except Exception as e:
-        logger.error(f"Error starting test suite: {e}")
+        logger.error("Error starting test suite: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/dashboard/agents")
-async def get_agents_status():
+async def get_agents_status(state: DashboardState = Depends(get_dashboard_state)):
     """Get agent registry status"""
     try:
-        if orchestrator:
+        if state.orchestrator:
             # Get real agent data from orchestrator
-            agent_assignments = orchestrator.agent_assignments
-            available_agents = orchestrator.available_agents
-            active_projects = orchestrator.get_active_projects()
+            agent_assignments = state.orchestrator.agent_assignments
+            available_agents = state.orchestrator.available_agents
+            active_projects = state.orchestrator.get_active_projects()
+            projects_by_id = {p.id: p for p in active_projects}
             
             # Calculate agent utilization
             busy_agents = len(agent_assignments)
@@ -452,13 +697,11 @@ async def get_agents_status():
             agents_detail = []
             for agent_id in available_agents:
                 project_id = agent_assignments.get(agent_id)
-                current_project = None
-                if project_id:
-                    current_project = next((p for p in active_projects if p.id == project_id), None)
+                current_project = projects_by_id.get(project_id) if project_id else None
                 
                 agents_detail.append({
                     "id": agent_id,
-                    "name": agent_id.replace('_', ' ').title(),
+                    "name": _agent_display_name(agent_id),
                     "status": "busy" if project_id else "idle",
                     "current_project": {
                         "id": current_project.id if current_project else None,
@@ -466,10 +709,19 @@ async def get_agents_status():
                         "progress": current_project.progress if current_project else 0
                     } if current_project else None,
                     "specialization": _get_agent_specialization(agent_id),
-                    "performance_score": 95.0 + (hash(agent_id) % 10),  # Mock performance
-                    "tasks_completed": 10 + (hash(agent_id) % 50)  # Mock task count
+                    "performance_score": _agent_perf_score(agent_id),  # Mock performance
+                    "tasks_completed": _agent_task_count(agent_id)  # Mock task count
                 })
             
+            # Team sizes in one pass over the projects
+            active_collaborations = 0
+            total_team_members = 0
+            for project in active_projects:
+                team_size = len(project.assigned_agents)
+                total_team_members += team_size
+                if team_size > 1:
+                    active_collaborations += 1
+            
             agents_data = {
                 "total_agents": len(available_agents),
                 "active_agents": len(available_agents),
@@ -478,9 +730,9 @@ async def get_agents_status():
                 "offline_agents": 0,
                 "agents_detail": agents_detail,
                 "collaboration_stats": {
-                    "active_collaborations": len([p for p in active_projects if len(p.assigned_agents) > 1]),
+                    "active_collaborations": active_collaborations,
                     "total_project_assignments": len(agent_assignments),
-                    "avg_team_size": sum(len(p.assigned_agents) for p in active_projects) / max(len(active_projects), 1)
+                    "avg_team_size": total_team_members / max(len(active_projects), 1)
                 }
             }
         else:
@@ -525,21 +777,50 @@ async def get_agents_status():
         }
         
     except Exception as e:
-        logger.error(f"Error getting agent status: {e}")
+        logger.error("Error getting agent status: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
+_AGENT_SPECIALIZATIONS = MappingProxyType({
+    "theory_agent": "Theoretical Physics & Mathematical Modeling",
+    "experimental_agent": "Experimental Design & Data Collection",
+    "analysis_agent": "Data Analysis & Statistical Modeling",
+    "literature_agent": "Literature Review & Knowledge Synthesis",
+    "safety_agent": "Safety Monitoring & Risk Assessment",
+    "meta_agent": "Meta-Research & Coordination"
+})
+
+# Mock per-agent stats, fixed for the process lifetime and filled on first sight
+_agent_perf_scores: Dict[str, float] = {}
+_agent_task_counts: Dict[str, int] = {}
+
+
+def _agent_perf_score(agent_id: str) -> float:
+    """Mock performance score for an agent"""
+    score = _agent_perf_scores.get(agent_id)
+    if score is None:
+        score = _agent_perf_scores[agent_id] = 95.0 + (hash(agent_id) % 10)
+    return score
+
+
+def _agent_task_count(agent_id: str) -> int:
+    """Mock completed-task count for an agent"""
+    count = _agent_task_counts.get(agent_id)
+    if count is None:
+        count = _agent_task_counts[agent_id] = 10 + (hash(agent_id) % 50)
+    return count
+
+
+@lru_cache(maxsize=64)
 def _get_agent_specialization(agent_id: str) -> str:
     """Get agent specialization based on ID"""
-    specializations = {
-        "theory_agent": "Theoretical Physics & Mathematical Modeling",
-        "experimental_agent": "Experimental Design & Data Collection",
-        "analysis_agent": "Data Analysis & Statistical Modeling",
-        "literature_agent": "Literature Review & Knowledge Synthesis",
-        "safety_agent": "Safety Monitoring & Risk Assessment",
-        "meta_agent": "Meta-Research & Coordination"
-    }
-    return specializations.get(agent_id, "General Research")
+    return _AGENT_SPECIALIZATIONS.get(agent_id, "General Research")
+
+
+@lru_cache(maxsize=64)
+def _agent_display_name(agent_id: str) -> str:
+    """Human-readable agent name derived from its ID"""
+    return agent_id.replace('_', ' ').title()
 
 
 @app.get("/api/dashboard/safety")
@@ -562,76 +843,127 @@ async def get_safety_status():
         )
         
     except Exception as e:
-        logger.error(f"Error getting safety status: {e}")
+        logger.error("Error getting safety status: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Simulated workflow steps and the delay between them
+WORKFLOW_STEPS = (
+    ("project_setup", 10.0),
+    ("literature_review", 25.0),
+    ("methodology_design", 40.0),
+    ("data_collection", 60.0),
+    ("analysis", 80.0),
+    ("quality_review", 95.0),
+    ("completion", 100.0)
+)
+WORKFLOW_STEP_SECONDS = 2.0
+
+
 async def execute_workflow_background(
+    state: DashboardState,
     cycle_id: str,
-    project: ResearchProject,
+    project: Optional[ResearchProject],
     template: str,
     parameters: Dict[str, Any]
 ):
-    """Execute workflow in background"""
+    """Execute workflow in background
+    
+    Runs the simulated workflows started in mock mode, when no
+    orchestrator is available. Steps are scheduled as timer callbacks on
+    the loop, so this returns immediately instead of holding a coroutine
+    open for the whole run.
+    """
     try:
-        logger.info(f"Starting workflow execution: {cycle_id}")
+        logger.info("Starting workflow execution: %s", cycle_id)
         
         # Update workflow status
-        active_workflows[cycle_id]["status"] = "running"
-        active_workflows[cycle_id]["current_step"] = "project_setup"
-        active_workflows[cycle_id]["progress"] = 10.0
-        
-        # Simulate workflow steps with progress updates
-        steps = [
-            ("project_setup", 10.0),
-            ("literature_review", 25.0),
-            ("methodology_design", 40.0),
-            ("data_collection", 60.0),
-            ("analysis", 80.0),
-            ("quality_review", 95.0),
-            ("completion", 100.0)
-        ]
-        
-        for step_name, progress in steps:
-            # Update progress
-            active_workflows[cycle_id]["current_step"] = step_name
-            active_workflows[cycle_id]["progress"] = progress
-            
-            # Broadcast progress update
-            if websocket_manager:
-                await websocket_manager.broadcast({
-                    "type": "workflow_progress_update",
-                    "data": {
-                        "cycle_id": cycle_id,
-                        "current_step": step_name,
-                        "progress_percentage": progress,
-                        "timestamp": datetime.now().isoformat()
-                    }
-                })
-            
-            # Simulate step execution time
-            await asyncio.sleep(2)
-        
-        # Mark workflow as completed
-        active_workflows[cycle_id]["status"] = "completed"
-        active_workflows[cycle_id]["completion_time"] = datetime.now()
-        
-        # Broadcast completion
-        if websocket_manager:
-            await websocket_manager.broadcast({
-                "type": "workflow_completed",
-                "data": {"cycle_id": cycle_id},
-                "timestamp": datetime.now().isoformat()
-            })
+        state.active_workflows.set_status(
+            cycle_id, "running", current_step="project_setup", progress=10.0
+        )
+        state.mark_workflow_transition()
         
-        logger.info(f"Workflow {cycle_id} completed successfully")
+        loop = asyncio.get_running_loop()
+        for index, (step_name, progress) in enumerate(WORKFLOW_STEPS):
+            loop.call_later(
+                index * WORKFLOW_STEP_SECONDS,
+                _advance_workflow, state, cycle_id, step_name, progress
+            )
+        loop.call_later(
+            len(WORKFLOW_STEPS) * WORKFLOW_STEP_SECONDS,
+            _complete_workflow, state, cycle_id
+        )
+        
+    except Exception as e:
+        logger.error("Error executing workflow %s: %s", cycle_id, e)
+        state.active_workflows.set_status(cycle_id, "failed", error=str(e))
+        state.mark_workflow_transition()
+
+
+def _advance_workflow(state: DashboardState, cycle_id: str, step_name: str, progress: float):
+    """Timer callback recording one simulated workflow step"""
+    try:
+        # Stop advancing once the workflow was stopped from the dashboard or evicted
+        if cycle_id not in state.active_workflows or state.active_workflows.is_finished(cycle_id):
+            return
+        
+        # Update progress
+        workflow = state.active_workflows[cycle_id]
+        workflow["current_step"] = step_name
+        workflow["progress"] = progress
+        state.mark_changed()
+        
+        # Broadcast progress update
+        if state.websocket_manager:
+            state.websocket_manager.enqueue({
+                "type": "workflow_progress_update",
+                "data": WorkflowProgressData(cycle_id, step_name, progress, datetime.now())
+            }, topics=(f"workflow:{cycle_id}", "workflows"))
         
     except Exception as e:
-        logger.error(f"Error executing workflow {cycle_id}: {e}")
-        active_workflows[cycle_id]["status"] = "failed"
-        active_workflows[cycle_id]["error"] = str(e)
+        logger.error("Error executing workflow %s: %s", cycle_id, e)
+        if cycle_id in state.active_workflows:
+            state.active_workflows.set_status(cycle_id, "failed", error=str(e))
+            state.mark_workflow_transition()
+
+
+def _complete_workflow(state: DashboardState, cycle_id: str):
+    """Timer callback marking a simulated workflow completed
+    
+    Callbacks run without yielding to the loop, so the finished check and
+    the status change cannot interleave with a concurrent stop.
+    """
+    if cycle_id not in state.active_workflows:
+        return
+    if state.active_workflows.is_finished(cycle_id):
+        logger.info("Workflow %s stopped before completion", cycle_id)
+        return
+    
+    state.active_workflows.set_status(cycle_id, "completed", completion_time=datetime.now())
+    state.mark_workflow_transition()
+    
+    # Broadcast completion
+    if state.websocket_manager:
+        state.websocket_manager.enqueue({
+            "type": "workflow_completed",
+            "data": {"cycle_id": cycle_id},
+            "timestamp": datetime.now()
+        }, topics=(f"workflow:{cycle_id}", "workflows"))
+    
+    logger.info("Workflow %s completed successfully", cycle_id)
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000) 
\ No newline at end of file
+    # Each worker builds its own DashboardState on app.state. With
+    # UVICORN_WORKERS > 1, WebSocket broadcasts are relayed between workers
+    # through Redis, but REST workflow state remains worker-sticky.
+    uvicorn.run(
+        "dashboard.backend.dashboard_api:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        ws_per_message_deflate=True,
+        workers=int(os.getenv("UVICORN_WORKERS", "1"))
+    ) 
\ No newline at end of file
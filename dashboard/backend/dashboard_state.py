@@ -0,0 +1,81 @@
+"""
+Dashboard State - per-worker container for dashboard services and tracked state
+"""
+
+import asyncio
+from typing import Dict, Any, Optional
+
+from fastapi import Request
+
+from core.orchestrator import ResearchOrchestrator
+from dashboard.backend.metrics_collector import SystemMetricsCollector
+from dashboard.backend.websocket_handler import WebSocketManager
+from dashboard.backend.test_runner import DashboardTestRunner
+from dashboard.backend.workflow_store import WorkflowStore
+from dashboard.backend.component_table import ComponentTable
+
+
+class DashboardState:
+    """Services and mutable state for one dashboard worker
+
+    An instance lives on ``app.state.dashboard`` for the lifetime of the
+    application, so each uvicorn worker owns an isolated copy instead of
+    sharing module globals.
+    """
+
+    # Workflow control is serialized per cycle ID across this many lock shards
+    WORKFLOW_LOCK_SHARDS = 64
+
+    def __init__(self):
+        # Services (populated during startup)
+        self.orchestrator: Optional[ResearchOrchestrator] = None
+        self.websocket_manager: Optional[WebSocketManager] = None
+        self.metrics_collector: Optional[SystemMetricsCollector] = None
+        self.test_runner: Optional[DashboardTestRunner] = None
+
+        # Tracked state
+        self.component_table = ComponentTable()
+        self.active_workflows = WorkflowStore()
+        self.system_metrics: Dict[str, Any] = {}
+        self.workflow_version = 0  # bumped on every workflow state transition
+        self.state_version = 0  # bumped on any change visible through the GET endpoints
+
+        # Serialized overview reused between metrics ticks
+        self.overview_cache: Optional[Dict[str, Any]] = None
+        self.overview_generated_at = 0.0  # time.monotonic(); 0 means stale
+        self.overview_table_version = -1  # component_table.version it was built from
+
+        self._workflow_locks = [asyncio.Lock() for _ in range(self.WORKFLOW_LOCK_SHARDS)]
+
+    def workflow_lock(self, cycle_id: str) -> asyncio.Lock:
+        """Lock guarding state transitions of one workflow
+
+        Unrelated workflows usually land on different shards, so they do
+        not serialize behind each other.
+        """
+        return self._workflow_locks[hash(cycle_id) % self.WORKFLOW_LOCK_SHARDS]
+
+    def mark_workflow_transition(self):
+        """Record a workflow state change so the next metrics tick broadcasts"""
+        self.workflow_version += 1
+        self.mark_changed()
+
+    def mark_changed(self):
+        """Record a change to metrics or workflow data served by the dashboard"""
+        self.state_version += 1
+        self.invalidate_overview()
+
+    def invalidate_overview(self):
+        """Force the next overview request to rebuild its response"""
+        self.overview_generated_at = 0.0
+
+    def etag(self) -> str:
+        """Weak ETag covering everything the polled GET endpoints render"""
+        orchestrator_version = self.orchestrator.state_version if self.orchestrator else 0
+        return f'W/"{self.state_version}-{self.component_table.version}-{orchestrator_version}"'
+
+
+def get_dashboard_state(request: Request) -> DashboardState:
+    """FastAPI dependency returning the worker's dashboard state"""
+    return request.app.state.dashboard
+
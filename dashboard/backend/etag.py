@@ -0,0 +1,51 @@
+"""
+ETag Middleware - conditional GET support for polled dashboard endpoints
+"""
+
+from typing import Iterable
+
+
+class StateETagMiddleware:
+    """Pure ASGI middleware answering unchanged polls with 304 Not Modified
+
+    The tag comes from ``app.state.dashboard.etag()``, a version string
+    that changes whenever the data behind the polled endpoints does, so a
+    matching ``If-None-Match`` is answered without running the endpoint or
+    serializing a body. Other paths and methods pass straight through.
+    """
+
+    def __init__(self, app, paths: Iterable[str]):
+        self.app = app
+        self.paths = frozenset(paths)
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or scope["path"] not in self.paths
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        dashboard = getattr(scope["app"].state, "dashboard", None)
+        if dashboard is None:
+            await self.app(scope, receive, send)
+            return
+
+        etag = dashboard.etag().encode("latin-1")
+        for name, value in scope["headers"]:
+            if name == b"if-none-match" and etag in (tag.strip() for tag in value.split(b",")):
+                await send({
+                    "type": "http.response.start",
+                    "status": 304,
+                    "headers": [(b"etag", etag)],
+                })
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+        async def send_with_etag(message):
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                message["headers"] = list(message.get("headers", ())) + [(b"etag", etag)]
+            await send(message)
+
+        await self.app(scope, receive, send_with_etag)
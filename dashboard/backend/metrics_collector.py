@@ -3,45 +3,186 @@ System Metrics Collector for Dashboard
 """
 
 import asyncio
+import os
+import sys
 import psutil
 import logging
-from typing import Dict, Any, Optional
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, Optional
 from datetime import datetime
 
 
 logger = logging.getLogger(__name__)
 
 
+# Subsets of psutil's result types, carrying only the fields the collector reads
+MemoryStats = namedtuple("MemoryStats", ["total", "used", "percent"])
+NetworkStats = namedtuple("NetworkStats", ["bytes_sent", "bytes_recv"])
+
+
+class _LinuxProcReader:
+    """Reads CPU, memory and network counters straight from /proc
+    
+    The files are opened once and re-read with pread() at offset 0, which
+    makes the kernel regenerate their contents, so each tick costs one
+    syscall per file and parses only the fields the collector needs.
+    """
+    
+    PATHS = ("/proc/stat", "/proc/meminfo", "/proc/net/dev")
+    
+    def __init__(self):
+        self._fds = {}
+        try:
+            for path in self.PATHS:
+                self._fds[path] = os.open(path, os.O_RDONLY)
+        except OSError:
+            self.close()
+            raise
+        self._last_cpu = self._cpu_times()
+    
+    def close(self):
+        for fd in self._fds.values():
+            os.close(fd)
+        self._fds.clear()
+    
+    def _read(self, path: str) -> bytes:
+        fd = self._fds[path]
+        chunks = []
+        offset = 0
+        while True:
+            chunk = os.pread(fd, 4096, offset)
+            if not chunk:
+                return b"".join(chunks)
+            chunks.append(chunk)
+            offset += len(chunk)
+    
+    def _cpu_times(self):
+        """(busy, total) jiffies from the aggregate line of /proc/stat"""
+        data = self._read("/proc/stat")
+        fields = data[:data.index(b"\n")].split()[1:9]
+        user, nice, system, idle, iowait, irq, softirq, steal = map(int, fields)
+        total = user + nice + system + idle + iowait + irq + softirq + steal
+        return total - idle - iowait, total
+    
+    def read_cpu(self) -> float:
+        """CPU utilisation percent since the previous call, like psutil.cpu_percent(None)"""
+        busy, total = self._cpu_times()
+        last_busy, last_total = self._last_cpu
+        self._last_cpu = (busy, total)
+        delta_total = total - last_total
+        if delta_total <= 0:
+            return 0.0
+        return round(100.0 * (busy - last_busy) / delta_total, 1)
+    
+    def read_memory(self) -> MemoryStats:
+        """Total and used (total minus available) memory in bytes"""
+        total = available = 0
+        for line in self._read("/proc/meminfo").splitlines():
+            if line.startswith(b"MemTotal:"):
+                total = int(line.split()[1]) * 1024
+            elif line.startswith(b"MemAvailable:"):
+                available = int(line.split()[1]) * 1024
+                break
+        used = total - available
+        percent = round(100.0 * used / total, 1) if total else 0.0
+        return MemoryStats(total, used, percent)
+    
+    def read_network(self) -> NetworkStats:
+        """Bytes sent and received, summed over all interfaces"""
+        sent = recv = 0
+        for line in self._read("/proc/net/dev").splitlines()[2:]:
+            fields = line.split(b":", 1)[1].split()
+            recv += int(fields[0])
+            sent += int(fields[8])
+        return NetworkStats(sent, recv)
+
+
 class SystemMetricsCollector:
     """Collects system performance metrics"""
     
+    # Weight of the newest CPU sample in the smoothed cpu_usage_ema metric
+    CPU_EMA_ALPHA = 0.3
+    
+    # Slow-moving metric groups are re-read at most this often (seconds);
+    # CPU, memory and network are sampled on every call
+    REFRESH_INTERVALS = {
+        "disk": 30.0,
+        "pids": 15.0,
+        "loadavg": 10.0,
+    }
+    
     def __init__(self):
         self.is_running = False
         self.last_network_stats = None
+        
+        # On Linux read /proc directly; elsewhere (or if /proc is unreadable) use psutil
+        self._proc: Optional[_LinuxProcReader] = None
+        if sys.platform == "linux":
+            try:
+                self._proc = _LinuxProcReader()
+            except OSError as e:
+                logger.warning(f"Falling back to psutil for metrics: {e}")
+        
+        if self._proc is not None:
+            self._read_cpu = self._proc.read_cpu
+            self._read_memory = self._proc.read_memory
+            self._read_network = self._proc.read_network
+        else:
+            # Prime psutil's CPU counters; the first non-blocking call always returns 0.0
+            psutil.cpu_percent(interval=None)
+            self._read_cpu = lambda: psutil.cpu_percent(interval=None)
+            self._read_memory = psutil.virtual_memory
+            self._read_network = psutil.net_io_counters
+        self._cpu_ema: Optional[float] = None
+        
+        # Cached slow-moving metric groups and when each was last read (monotonic)
+        self._cache: Dict[str, Any] = {}
+        self._last_refresh: Dict[str, float] = {}
+        
+        # A dedicated thread keeps psutil work off the loop without queueing behind
+        # other to_thread() callers, and serializes access to the state above
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="metrics-collector")
         logger.info("System metrics collector initialized")
     
     async def collect_metrics(self) -> Dict[str, Any]:
-        """Collect current system metrics"""
+        """Collect current system metrics without blocking the event loop
+        
+        psutil reads /proc (and scans it for the process count), so the
+        work runs on the collector's own thread.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.collect_metrics_sync)
+    
+    def collect_metrics_sync(self) -> Dict[str, Any]:
+        """Collect current system metrics (blocking; run off the event loop)"""
         try:
             metrics = {}
             
-            # CPU usage
-            metrics["cpu_usage"] = psutil.cpu_percent(interval=1)
+            # CPU usage since the previous call (non-blocking)
+            cpu_usage = self._read_cpu()
+            if self._cpu_ema is None:
+                self._cpu_ema = cpu_usage
+            else:
+                self._cpu_ema += self.CPU_EMA_ALPHA * (cpu_usage - self._cpu_ema)
+            metrics["cpu_usage"] = cpu_usage
+            metrics["cpu_usage_ema"] = self._cpu_ema
             
             # Memory usage
-            memory = psutil.virtual_memory()
+            memory = self._read_memory()
             metrics["memory_usage"] = memory.percent
             metrics["memory_total_gb"] = memory.total / (1024**3)
             metrics["memory_used_gb"] = memory.used / (1024**3)
             
             # Disk usage
-            disk = psutil.disk_usage('/')
+            disk = self._maybe_refresh("disk", lambda: psutil.disk_usage('/'))
             metrics["disk_usage"] = (disk.used / disk.total) * 100
             metrics["disk_total_gb"] = disk.total / (1024**3)
             metrics["disk_used_gb"] = disk.used / (1024**3)
             
             # Network I/O
-            network = psutil.net_io_counters()
+            network = self._read_network()
             if self.last_network_stats:
                 metrics["network_bytes_sent_delta"] = network.bytes_sent - self.last_network_stats.bytes_sent
                 metrics["network_bytes_recv_delta"] = network.bytes_recv - self.last_network_stats.bytes_recv
@@ -54,11 +195,11 @@ class SystemMetricsCollector:
             metrics["network_bytes_recv"] = network.bytes_recv
             
             # Process count
-            metrics["process_count"] = len(psutil.pids())
+            metrics["process_count"] = self._maybe_refresh("pids", lambda: len(psutil.pids()))
             
             # Load average (Unix-like systems)
             try:
-                load_avg = psutil.getloadavg()
+                load_avg = self._maybe_refresh("loadavg", psutil.getloadavg)
                 metrics["load_1min"] = load_avg[0]
                 metrics["load_5min"] = load_avg[1]
                 metrics["load_15min"] = load_avg[2]
@@ -87,6 +228,15 @@ class SystemMetricsCollector:
                 "timestamp": datetime.now().isoformat()
             }
     
+    def _maybe_refresh(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Return the cached value for a metric group, re-reading it once its interval elapses"""
+        now = time.monotonic()
+        last = self._last_refresh.get(key)
+        if last is None or now - last >= self.REFRESH_INTERVALS[key]:
+            self._cache[key] = fn()
+            self._last_refresh[key] = now
+        return self._cache[key]
+    
     async def start(self):
         """Start periodic metrics collection"""
         self.is_running = True
@@ -95,6 +245,10 @@ class SystemMetricsCollector:
     async def stop(self):
         """Stop metrics collection"""
         self.is_running = False
+        # A read cancelled on the loop side may still be running in the worker thread
+        await asyncio.to_thread(self._executor.shutdown)
+        if self._proc is not None:
+            self._proc.close()
         logger.info("Stopped system metrics collection")
     
     async def get_system_info(self) -> Dict[str, Any]:
@@ -7,7 +7,10 @@ import subprocess
 import logging
 import json
 import os
-from typing import Dict, Any, Optional, List
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, List
 from datetime import datetime
 from dashboard.shared.events import create_test_progress_event
 
@@ -15,9 +18,41 @@ from dashboard.shared.events import create_test_progress_event
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=64)
+def _test_event_template(test_id: str, test_name: str, phase: str) -> Dict[str, Any]:
+    """Test progress event message for one test phase, reused across its updates
+    
+    Progress and results are overlaid per update, so the event is only
+    built once per (test, name, phase). The timestamp is left out for
+    WebSocketManager.enqueue to stamp. Callers must copy before changing it.
+    """
+    template = create_test_progress_event(test_id, test_name, 0.0, phase).to_dict()
+    del template["timestamp"]
+    return template
+
+
 class DashboardTestRunner:
     """Execute and monitor test suites from dashboard"""
     
+    # Spawned suites skip the cache and warning plugins; -v stays on because
+    # progress is parsed from the per-test PASSED/FAILED lines
+    PYTEST_ARGS = ("-v", "--tb=short", "-p", "no:cacheprovider", "-p", "no:warnings")
+    
+    # Subprocess output is read in chunks of this many bytes
+    READ_CHUNK_SIZE = 64 * 1024
+    
+    # Minimum seconds between progress events for one test run
+    PROGRESS_EVENT_INTERVAL = 0.1
+    
+    # Lowercased pytest phase markers in precedence order, with their progress.
+    # Test results are checked first, so phase words inside a test ID
+    # (e.g. ``test_collected_items PASSED``) never mask the result.
+    PHASE_PROGRESS = (
+        (b"test session starts", 5.0),
+        (b"collecting", 15.0),
+        (b"collected", 25.0)
+    )
+    
     def __init__(self, websocket_manager):
         self.websocket_manager = websocket_manager
         self.running_tests: Dict[str, Dict[str, Any]] = {}
@@ -41,6 +76,8 @@ class DashboardTestRunner:
                 "start_time": datetime.now(),
                 "progress": 0.0,
                 "current_phase": "initialization",
+                "passed": 0,
+                "failed": 0,
                 "results": {}
             }
             
@@ -88,34 +125,56 @@ class DashboardTestRunner:
             )
             
             # Build command
-            cmd = ["python", "-m", "pytest", test_file, "-v", "--tb=short"]
+            cmd = (sys.executable, "-m", "pytest", test_file, *self.PYTEST_ARGS)
             
-            # Start subprocess
+            # Start subprocess; fds are non-inheritable by default, so skip the close loop
             process = await asyncio.create_subprocess_exec(
                 *cmd,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.STDOUT,
-                cwd=os.getcwd()
+                cwd=os.getcwd(),
+                close_fds=False,
+                start_new_session=True
             )
             
-            # Stream output
+            # Stream output in chunks, splitting lines in memory
             output_lines = []
+            test_run = self.running_tests[test_id]
+            test_run.setdefault("passed", 0)
+            test_run.setdefault("failed", 0)
+            loop = asyncio.get_running_loop()
+            last_event_time = float("-inf")
+            buffer = bytearray()
             while True:
-                line = await process.stdout.readline()
-                if not line:
-                    break
+                chunk = await process.stdout.read(self.READ_CHUNK_SIZE)
+                if chunk:
+                    buffer.extend(chunk)
+                    lines = buffer.split(b"\n")
+                    buffer = lines.pop()  # incomplete trailing line
+                else:
+                    lines = [buffer] if buffer else []
                 
-                line_str = line.decode('utf-8').strip()
-                output_lines.append(line_str)
+                for line in lines:
+                    line_str = line.decode('utf-8').strip()
+                    output_lines.append(line_str)
+                    test_run["passed"] += b"PASSED" in line
+                    test_run["failed"] += b"FAILED" in line
+                    
+                    # Parse progress from output; events are rate-limited
+                    completed = test_run["passed"] + test_run["failed"]
+                    progress = self._parse_test_progress(test_id, line, completed)
+                    if progress > test_run["progress"]:
+                        test_run["progress"] = progress
+                        now = loop.time()
+                        if now - last_event_time >= self.PROGRESS_EVENT_INTERVAL:
+                            last_event_time = now
+                            await self._send_test_event(
+                                test_id, "Test Progress", progress, "executing",
+                                {"current_output": line_str}
+                            )
                 
-                # Parse progress from output
-                progress = self._parse_test_progress(line_str, output_lines)
-                if progress > self.running_tests[test_id]["progress"]:
-                    self.running_tests[test_id]["progress"] = progress
-                    await self._send_test_event(
-                        test_id, "Test Progress", progress, "executing",
-                        {"current_output": line_str}
-                    )
+                if not chunk:
+                    break
             
             # Wait for completion
             return_code = await process.wait()
@@ -139,6 +198,8 @@ class DashboardTestRunner:
             self.running_tests[test_id]["results"] = {
                 "return_code": return_code,
                 "output_lines": len(output_lines),
+                "passed": test_run["passed"],
+                "failed": test_run["failed"],
                 "success": return_code == 0
             }
             
@@ -152,25 +213,24 @@ class DashboardTestRunner:
                 test_id, "Test Execution Error", 0.0, "error", {"error": str(e)}
             )
     
-    def _parse_test_progress(self, line: str, all_lines: List[str]) -> float:
-        """Parse test progress from output line"""
+    def _parse_test_progress(self, test_id: str, line: bytes, completed: int) -> float:
+        """Parse test progress from a raw output line
+        
+        ``completed`` is the running PASSED + FAILED count so far, including
+        this line.
+        """
         try:
-            # Simple progress estimation based on output patterns
-            if "PASSED" in line or "FAILED" in line:
-                # Count completed tests
-                completed = sum(1 for l in all_lines if "PASSED" in l or "FAILED" in l)
+            if b"PASSED" in line or b"FAILED" in line:
                 # Estimate total tests (rough approximation)
                 total_estimated = max(completed + 1, 10)
                 return min((completed / total_estimated) * 90, 90.0)
             
-            elif "test session starts" in line.lower():
-                return 5.0
-            elif "collecting" in line.lower():
-                return 15.0
-            elif "collected" in line.lower():
-                return 25.0
+            lowered = line.lower()
+            for marker, progress in self.PHASE_PROGRESS:
+                if marker in lowered:
+                    return progress
             
-            return self.running_tests.get(self.test_id, {}).get("progress", 0.0)
+            return self.running_tests.get(test_id, {}).get("progress", 0.0)
             
         except Exception:
             return 0.0
@@ -186,10 +246,18 @@ class DashboardTestRunner:
         """Send test progress event via WebSocket"""
         try:
             if self.websocket_manager:
-                event = create_test_progress_event(
-                    test_id, test_name, progress, phase, results
+                template = _test_event_template(test_id, test_name, phase)
+                message = {
+                    **template,
+                    "data": {
+                        **template["data"],
+                        "progress_percentage": progress,
+                        "results": results or {}
+                    }
+                }
+                self.websocket_manager.enqueue(
+                    message, topics=(f"test:{test_id}", "tests")
                 )
-                await self.websocket_manager.broadcast(event.dict())
                 
         except Exception as e:
             logger.error(f"Error sending test event: {e}")
@@ -198,9 +266,9 @@ class DashboardTestRunner:
         """Get status of running test"""
         return self.running_tests.get(test_id)
     
-    async def get_all_tests(self) -> Dict[str, Dict[str, Any]]:
-        """Get status of all tests"""
-        return self.running_tests.copy()
+    async def get_all_tests(self) -> Mapping[str, Dict[str, Any]]:
+        """Get a read-only view of all tests"""
+        return MappingProxyType(self.running_tests)
     
     async def stop_test(self, test_id: str) -> bool:
         """Stop a running test"""
@@ -3,105 +3,438 @@ WebSocket Handler for Real-time Dashboard Communication
 """
 
 import asyncio
-import json
 import logging
-from typing import Dict, List, Any, Optional, Set
+import time
+import zlib
+import orjson
+from collections import deque
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Any, Iterable, Mapping, Optional, Tuple
 from datetime import datetime
 
 
 logger = logging.getLogger(__name__)
 
+# Messages stamped within this many seconds of each other share one timestamp
+TIMESTAMP_RESOLUTION = 0.05
+_timestamp_cache = [float("-inf"), datetime.now()]  # [monotonic read time, timestamp]
+
+
+def _cached_now() -> datetime:
+    """Current time, re-read from the wall clock at most every TIMESTAMP_RESOLUTION seconds"""
+    now = time.monotonic()
+    if now - _timestamp_cache[0] > TIMESTAMP_RESOLUTION:
+        _timestamp_cache[0] = now
+        _timestamp_cache[1] = datetime.now()
+    return _timestamp_cache[1]
+
 
 class WebSocketManager:
-    """Manages WebSocket connections and real-time event broadcasting"""
+    """Manages WebSocket connections and real-time event broadcasting
+    
+    Messages may be tagged with topics; a client subscribed to topics only
+    receives messages tagged with one of them. Untagged messages, and
+    clients without subscriptions, match everything.
+    """
+    
+    # Payloads buffered per client before further ones are dropped for it
+    CLIENT_OUTBOX_SIZE = 256
+    
+    # Payloads above this size are zlib-compressed for clients that opted in
+    COMPRESS_THRESHOLD = 1024
+    
+    # Message types where only the latest event per data key matters in one drain
+    COALESCE_KEYS = {
+        "workflow_progress_update": "cycle_id",
+        "test_progress_update": "test_id"
+    }
+    
+    # Messages held per offline client; the oldest are dropped beyond this
+    MESSAGE_QUEUE_SIZE = 1024
     
-    def __init__(self):
-        # Connected clients tracking
+    # Client-chosen subscriptions are capped so they cannot grow server state without bound
+    MAX_CLIENT_TOPICS = 64
+    MAX_TOPIC_LENGTH = 128
+    
+    def __init__(self, batch_interval: float = 0.05, max_batch_size: int = 100):
+        # Connected clients tracking; each record holds its topic set under "subs"
         self.connected_clients: Dict[str, Dict[str, Any]] = {}
-        self.client_subscriptions: Dict[str, Set[str]] = {}
+        
+        # Clients grouped by subscription set, rebuilt lazily after membership changes
+        self._groups: Optional[Dict[frozenset, List[Dict[str, Any]]]] = None
+        
+        # Last delivery time per subscription set; folded into client activity on query
+        self._group_activity: Dict[frozenset, datetime] = {}
         
         # Message queue for offline clients
-        self.message_queue: Dict[str, List[Dict[str, Any]]] = {}
+        self.message_queue: Dict[str, deque] = {}
+        
+        # Outgoing broadcasts, coalesced into one frame per client per drain
+        self.batch_interval = batch_interval
+        self.max_batch_size = max_batch_size
+        self._outbox: asyncio.Queue = asyncio.Queue()
+        self._pending = asyncio.Event()
+        self._batch_full = asyncio.Event()
+        self._drain_task: Optional[asyncio.Task] = None
+        
+        # Shares drained batches with other workers (see RedisBroadcastRelay)
+        self.relay = None
         
         logger.info("WebSocket manager initialized")
     
+    async def start(self):
+        """Start the background task that drains queued broadcasts"""
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.create_task(self._drain_outbox())
+    
+    async def stop(self):
+        """Flush pending broadcasts and stop the drain task"""
+        if self._drain_task:
+            self._drain_task.cancel()
+            try:
+                await self._drain_task
+            except asyncio.CancelledError:
+                pass
+            self._drain_task = None
+        await self._flush_outbox()
+    
+    def enqueue(self, message: Dict[str, Any], topics: Tuple[str, ...] = ()):
+        """Queue a message for the next batched broadcast"""
+        if 'timestamp' not in message:
+            message['timestamp'] = _cached_now()
+        
+        self._outbox.put_nowait((topics, message))
+        self._pending.set()
+        if self._outbox.qsize() >= self.max_batch_size:
+            self._batch_full.set()
+    
+    async def _drain_outbox(self):
+        """Flush the outbox one batch interval after a message arrives, or early once it fills up
+        
+        The task sleeps while the outbox is empty instead of polling it.
+        """
+        while True:
+            await self._pending.wait()
+            try:
+                await asyncio.wait_for(self._batch_full.wait(), timeout=self.batch_interval)
+            except asyncio.TimeoutError:
+                pass
+            # _flush_outbox drains the queue before its first await, so nothing enqueued is missed
+            self._pending.clear()
+            self._batch_full.clear()
+            await self._flush_outbox()
+    
+    def publish(self, topic: str, message: Dict[str, Any]):
+        """Queue a message for clients subscribed to ``topic``"""
+        self.enqueue(message, (topic,))
+    
+    async def _flush_outbox(self):
+        """Send all queued messages as a single frame per client"""
+        batch = []
+        while not self._outbox.empty():
+            batch.append(self._outbox.get_nowait())
+        
+        if not batch:
+            return
+        
+        batch = self._coalesce(batch)
+        if self.relay is not None:
+            await self.relay.publish(batch)
+        await self.deliver_batch(batch)
+    
+    async def deliver_batch(self, batch: List[Tuple[Tuple[str, ...], Dict[str, Any]]]):
+        """Send a drained batch to local clients as a single frame per client"""
+        # Clients with identical subscriptions share one frame
+        for subscriptions, clients in self._client_groups().items():
+            messages = [
+                message for topics, message in batch
+                if self._matches(subscriptions, topics)
+            ]
+            if not messages:
+                continue
+            self._group_activity[subscriptions] = _cached_now()
+            if len(messages) == 1:
+                await self._deliver(messages[0], clients)
+            else:
+                await self._deliver({"type": "multi", "payload": messages}, clients)
+    
+    def _client_groups(self) -> Dict[frozenset, List[Dict[str, Any]]]:
+        """Connected clients keyed by their subscription set
+        
+        Cached between connects, disconnects and subscription changes, so
+        broadcasts do not regroup every client. A rebuild replaces the dict
+        rather than mutating it, so callers may keep iterating a snapshot
+        while clients disconnect.
+        """
+        if self._groups is None:
+            groups: Dict[frozenset, List[Dict[str, Any]]] = {}
+            for client in self.connected_clients.values():
+                groups.setdefault(client["subs"], []).append(client)
+            self._groups = groups
+        return self._groups
+    
+    @staticmethod
+    def _matches(subscriptions: FrozenSet[str], topics: Iterable[str]) -> bool:
+        """Whether a client with ``subscriptions`` should receive a message tagged ``topics``"""
+        return not topics or not subscriptions or not subscriptions.isdisjoint(topics)
+    
     async def connect_client(self, client_id: str, client_info: Dict[str, Any]):
-        """Handle client connection"""
+        """Handle client connection
+        
+        ``client_info`` may carry the live socket under ``"websocket"``;
+        clients without one are tracked but only receive simulated sends.
+        Live sockets get a bounded outbox drained by their own writer task.
+        An optional ``"topics"`` entry sets the initial subscriptions.
+        Clients that set ``"compress"`` receive large payloads as zlib
+        streams; these start with byte 0x78 rather than ``{`` so the client
+        can tell them apart from plain JSON.
+        """
         try:
+            now = datetime.now()
             self.connected_clients[client_id] = {
                 **client_info,
-                "connected_at": datetime.now(),
-                "last_activity": datetime.now()
+                "connected_at": now,
+                "last_activity": now,
+                "subs": self._limit_topics(frozenset(), client_info.get("topics", ()))
             }
-            self.client_subscriptions[client_id] = set()
+            self._invalidate_groups()
             
-            logger.info(f"Client connected: {client_id}")
+            # A dedicated writer per socket keeps slow clients from stalling broadcasts
+            websocket = client_info.get("websocket")
+            if websocket is not None:
+                client = self.connected_clients[client_id]
+                client["outbox"] = asyncio.Queue(maxsize=self.CLIENT_OUTBOX_SIZE)
+                client["writer"] = asyncio.create_task(
+                    self._write_client(client_id, websocket, client["outbox"])
+                )
             
-            # Send any queued messages
-            if client_id in self.message_queue:
-                for message in self.message_queue[client_id]:
-                    await self.send_to_client(client_id, message)
-                del self.message_queue[client_id]
+            logger.info("Client connected: %s", client_id)
+            
+            # Replay queued messages as one frame
+            queued = self.message_queue.pop(client_id, None)
+            if queued:
+                await self._replay(client_id, queued)
                 
         except Exception as e:
-            logger.error(f"Error handling client connection: {e}")
+            logger.error("Error handling client connection: %s", e)
     
     async def disconnect_client(self, client_id: str):
         """Handle client disconnection"""
         try:
-            if client_id in self.connected_clients:
-                logger.info(f"Client disconnected: {client_id}")
-                del self.connected_clients[client_id]
+            client = self.connected_clients.pop(client_id, None)
+            if client is not None:
+                logger.info("Client disconnected: %s", client_id)
+                self._invalidate_groups()
                 
-            if client_id in self.client_subscriptions:
-                del self.client_subscriptions[client_id]
+                writer = client.get("writer")
+                if writer is not None and writer is not asyncio.current_task():
+                    writer.cancel()
                 
         except Exception as e:
-            logger.error(f"Error handling client disconnection: {e}")
+            logger.error("Error handling client disconnection: %s", e)
+    
+    async def subscribe(self, client_id: str, topics: Iterable[str]):
+        """Add topic subscriptions for a connected client"""
+        client = self.connected_clients.get(client_id)
+        if client is not None:
+            # Copy-on-write: the frozenset also keys the client's broadcast group
+            subs = self._limit_topics(client["subs"], topics)
+            if subs != client["subs"]:
+                client["subs"] = subs
+                self._invalidate_groups()
+    
+    def is_subscribed(self, client_id: str, topic: str) -> bool:
+        """Whether a connected client receives messages published to ``topic``"""
+        client = self.connected_clients.get(client_id)
+        return client is not None and self._matches(client["subs"], (topic,))
+    
+    def _limit_topics(self, current: FrozenSet[str], topics: Iterable[str]) -> FrozenSet[str]:
+        """Add ``topics`` to ``current``, keeping only valid topics up to the per-client cap
+        
+        A bare string is rejected rather than unioned character by
+        character; non-string, empty and overlong topics are skipped.
+        """
+        if isinstance(topics, (str, bytes)):
+            logger.debug("Ignoring subscription given as a single string")
+            return current
+        
+        subs = set(current)
+        for topic in topics:
+            if len(subs) >= self.MAX_CLIENT_TOPICS:
+                logger.debug("Subscription limit of %s topics reached", self.MAX_CLIENT_TOPICS)
+                break
+            if isinstance(topic, str) and 0 < len(topic) <= self.MAX_TOPIC_LENGTH:
+                subs.add(topic)
+        return frozenset(subs)
+    
+    def _invalidate_groups(self):
+        """Drop the cached client groups after a membership or subscription change
+        
+        Delivery times are recorded per group, so they are folded into the
+        clients first and then discarded; group keys that no longer exist
+        would otherwise accumulate forever.
+        """
+        self._fold_group_activity()
+        self._group_activity = {}
+        self._groups = None
+    
+    def _fold_group_activity(self):
+        """Copy each group's last delivery time into its clients' last_activity"""
+        if self._groups is None:
+            return
+        for subscriptions, clients in self._groups.items():
+            delivered_at = self._group_activity.get(subscriptions)
+            if delivered_at is None:
+                continue
+            for client in clients:
+                if delivered_at > client["last_activity"]:
+                    client["last_activity"] = delivered_at
+    
+    async def _replay(self, client_id: str, queued: Iterable[Dict[str, Any]]):
+        """Deliver messages queued while a client was offline"""
+        messages = [message for _, message in self._coalesce([((), message) for message in queued])]
+        client = self.connected_clients[client_id]
+        client["last_activity"] = _cached_now()
+        if len(messages) == 1:
+            await self._deliver(messages[0], [client])
+        else:
+            await self._deliver({"type": "multi", "payload": messages}, [client])
+    
+    @staticmethod
+    def _message_type(message: Dict[str, Any]) -> Optional[str]:
+        """Type of a plain message or a dumped DashboardEvent"""
+        return message.get("type") or message.get("event_type")
+    
+    def _coalesce(self, batch: List[Tuple[Tuple[str, ...], Dict[str, Any]]]) -> List[Tuple[Tuple[str, ...], Dict[str, Any]]]:
+        """Drop superseded events, keeping the latest one per coalescing key"""
+        latest = {}
+        for index, (_, message) in enumerate(batch):
+            message_type = self._message_type(message)
+            key_field = self.COALESCE_KEYS.get(message_type)
+            if key_field:
+                # Data may be a dict or a slotted carrier such as WorkflowProgressData
+                data = message.get("data", {})
+                if isinstance(data, dict):
+                    key_value = data.get(key_field)
+                else:
+                    key_value = getattr(data, key_field, None)
+                latest[(message_type, key_value)] = index
+        
+        if not latest:
+            return batch
+        
+        keep = set(latest.values())
+        return [
+            entry for index, entry in enumerate(batch)
+            if index in keep or self._message_type(entry[1]) not in self.COALESCE_KEYS
+        ]
     
-    async def broadcast(self, message: Dict[str, Any], event_type: Optional[str] = None):
-        """Broadcast message to all connected clients"""
+    async def broadcast(self, message: Dict[str, Any], topics: Tuple[str, ...] = ()):
+        """Broadcast message to all connected clients subscribed to any of ``topics``"""
         try:
             # Add timestamp if not present
             if 'timestamp' not in message:
-                message['timestamp'] = datetime.now().isoformat()
+                message['timestamp'] = _cached_now()
             
-            # Simulate broadcasting (in real implementation, would send via WebSocket)
-            logger.info(f"Broadcasting message to {len(self.connected_clients)} clients: {message.get('type', 'unknown')}")
+            recipients = [
+                client
+                for subscriptions, clients in self._client_groups().items()
+                if self._matches(subscriptions, topics)
+                for client in clients
+            ]
+            current_time = _cached_now()
+            for client in recipients:
+                client["last_activity"] = current_time
+            await self._deliver(message, recipients)
+                
+        except Exception as e:
+            logger.error("Error broadcasting message: %s", e)
+    
+    async def _deliver(self, message: Dict[str, Any], clients: List[Dict[str, Any]]):
+        """Serialize a message once and queue it for the given clients' writers"""
+        try:
+            logger.info("Broadcasting message to %s clients: %s", len(clients), message.get('type', 'unknown'))
+            
+            # Split live clients by encoding; callers record client activity
+            plain_clients = []
+            compress_clients = []
+            for client in clients:
+                if "outbox" in client:
+                    if client.get("compress"):
+                        compress_clients.append(client)
+                    else:
+                        plain_clients.append(client)
+            
+            if not plain_clients and not compress_clients:
+                return
+            
+            # Serialize (and compress) once, outside the per-client loop
+            payload = orjson.dumps(message, default=str)
+            if compress_clients and len(payload) > self.COMPRESS_THRESHOLD:
+                self._fan_out(compress_clients, zlib.compress(payload, 1))
+            else:
+                plain_clients.extend(compress_clients)
             
-            # Update client activity
-            current_time = datetime.now()
-            for client_id in self.connected_clients:
-                self.connected_clients[client_id]["last_activity"] = current_time
+            if plain_clients:
+                self._fan_out(plain_clients, payload)
                 
         except Exception as e:
-            logger.error(f"Error broadcasting message: {e}")
+            logger.error("Error broadcasting message: %s", e)
+    
+    def _fan_out(self, clients: List[Dict[str, Any]], payload: bytes):
+        """Queue a pre-serialized payload on each client's outbox without waiting for sends
+        
+        A client whose outbox is full is too slow to keep up, so the payload
+        is dropped for it; drops are logged once per fan-out.
+        """
+        dropped = 0
+        for client in clients:
+            try:
+                client["outbox"].put_nowait(payload)
+            except asyncio.QueueFull:
+                dropped += 1
+        
+        if dropped:
+            logger.debug("Dropped payload for %s of %s slow clients", dropped, len(clients))
+    
+    async def _write_client(self, client_id: str, websocket: Any, outbox: asyncio.Queue):
+        """Send a client's queued payloads in order; the only task writing to its socket"""
+        while True:
+            payload = await outbox.get()
+            try:
+                await websocket.send_bytes(payload)
+            except Exception as e:
+                logger.debug("Failed to send to client %s: %s", client_id, e)
+                await self.disconnect_client(client_id)
+                return
     
     async def send_to_client(self, client_id: str, message: Dict[str, Any]):
         """Send message to specific client"""
         try:
-            if client_id in self.connected_clients:
-                message['timestamp'] = datetime.now().isoformat()
-                logger.debug(f"Sent message to client {client_id}")
-                
-                # Update last activity
-                self.connected_clients[client_id]["last_activity"] = datetime.now()
+            client = self.connected_clients.get(client_id)
+            if client is not None:
+                message['timestamp'] = _cached_now()
+                client["last_activity"] = message['timestamp']
+                await self._deliver(message, [client])
+                logger.debug("Sent message to client %s", client_id)
             else:
                 # Queue message for offline client
                 if client_id not in self.message_queue:
-                    self.message_queue[client_id] = []
+                    self.message_queue[client_id] = deque(maxlen=self.MESSAGE_QUEUE_SIZE)
                 
-                message['queued_at'] = datetime.now().isoformat()
+                message['queued_at'] = _cached_now()
                 self.message_queue[client_id].append(message)
                 
-                logger.debug(f"Queued message for offline client {client_id}")
+                logger.debug("Queued message for offline client %s", client_id)
                 
         except Exception as e:
-            logger.error(f"Error sending message to client {client_id}: {e}")
+            logger.error("Error sending message to client %s: %s", client_id, e)
     
-    async def get_connected_clients(self) -> Dict[str, Dict[str, Any]]:
-        """Get information about connected clients"""
-        return self.connected_clients.copy()
+    async def get_connected_clients(self) -> Mapping[str, Dict[str, Any]]:
+        """Get a read-only view of connected clients"""
+        # Batched deliveries are recorded per subscription set; fold them in here
+        self._fold_group_activity()
+        return MappingProxyType(self.connected_clients)
     
     async def get_client_count(self) -> int:
         """Get number of connected clients"""
@@ -114,7 +447,7 @@ class WebSocketManager:
             for client_id in clients:
                 await self.disconnect_client(client_id)
             
-            logger.info(f"Disconnected all {len(clients)} clients")
+            logger.info("Disconnected all %s clients", len(clients))
             
         except Exception as e:
-            logger.error(f"Error disconnecting all clients: {e}")
+            logger.error("Error disconnecting all clients: %s", e)
@@ -0,0 +1,73 @@
+"""
+Workflow Store - bounded tracking of dashboard workflow records
+"""
+
+import time
+from collections import OrderedDict
+from typing import Dict, Any, ItemsView, Tuple
+
+
+class WorkflowStore:
+    """Workflow records keyed by cycle ID, with bounded retention of finished ones
+
+    Live workflows are kept until they reach a terminal status. Finished
+    workflows are retained for ``ttl_seconds`` and capped at ``max_finished``
+    entries, evicting the oldest first, so the store cannot grow without bound.
+    """
+
+    TERMINAL_STATUSES = frozenset({"completed", "failed", "stopped"})
+
+    def __init__(self, max_finished: int = 10_000, ttl_seconds: float = 3600.0):
+        self.max_finished = max_finished
+        self.ttl_seconds = ttl_seconds
+        self._live: Dict[str, Dict[str, Any]] = {}
+        self._finished: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    def __contains__(self, cycle_id: str) -> bool:
+        return cycle_id in self._live or cycle_id in self._finished
+
+    def __getitem__(self, cycle_id: str) -> Dict[str, Any]:
+        record = self._live.get(cycle_id)
+        if record is not None:
+            return record
+        return self._finished[cycle_id][1]
+
+    def __len__(self) -> int:
+        return len(self._live) + len(self._finished)
+
+    def add(self, cycle_id: str, record: Dict[str, Any]):
+        """Track a newly started workflow"""
+        self._live[cycle_id] = record
+        self._prune()
+
+    def set_status(self, cycle_id: str, status: str, **fields: Any):
+        """Update a workflow's status, retiring it once the status is terminal"""
+        record = self[cycle_id]
+        record["status"] = status
+        record.update(fields)
+
+        if status in self.TERMINAL_STATUSES and cycle_id in self._live:
+            del self._live[cycle_id]
+            self._finished[cycle_id] = (time.monotonic(), record)
+            self._prune()
+
+    def is_finished(self, cycle_id: str) -> bool:
+        """Whether the workflow has reached a terminal status"""
+        return cycle_id in self._finished
+
+    def live_items(self) -> ItemsView[str, Dict[str, Any]]:
+        """Workflows that have not yet reached a terminal status"""
+        return self._live.items()
+
+    def live_count(self) -> int:
+        return len(self._live)
+
+    def _prune(self):
+        """Evict finished workflows past their TTL or beyond the size cap"""
+        cutoff = time.monotonic() - self.ttl_seconds
+        finished = self._finished
+        while finished:
+            finished_at, _ = next(iter(finished.values()))
+            if finished_at >= cutoff and len(finished) <= self.max_finished:
+                break
+            finished.popitem(last=False)
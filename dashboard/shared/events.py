@@ -2,9 +2,9 @@
 WebSocket Event Definitions for Dashboard Real-time Communication
 """
 
+from dataclasses import dataclass
 from enum import Enum
 from typing import Dict, Any, Optional, List
-from pydantic import BaseModel
 from datetime import datetime
 
 
@@ -65,8 +65,13 @@ class EventType(str, Enum):
     HEARTBEAT = "heartbeat"
 
 
-class DashboardEvent(BaseModel):
-    """Base dashboard event model"""
+@dataclass(slots=True, frozen=True)
+class DashboardEvent:
+    """Base dashboard event
+    
+    Events are built internally by the factories below, so fields are not
+    validated; construction is a plain slot assignment.
+    """
     
     event_type: EventType
     timestamp: datetime
@@ -74,6 +79,31 @@ class DashboardEvent(BaseModel):
     event_id: Optional[str] = None
     source_component: Optional[str] = None
     priority: Optional[int] = 1  # 1=low, 2=medium, 3=high, 4=critical
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow dict form accepted by WebSocketManager.enqueue"""
+        return {
+            "event_type": self.event_type,
+            "timestamp": self.timestamp,
+            "data": self.data,
+            "event_id": self.event_id,
+            "source_component": self.source_component,
+            "priority": self.priority
+        }
+
+
+@dataclass(slots=True)
+class WorkflowProgressData:
+    """Data of a high-frequency workflow progress broadcast
+
+    A slotted carrier instead of a dict; orjson serializes it to the same
+    JSON object.
+    """
+
+    cycle_id: str
+    current_step: str
+    progress_percentage: float
+    timestamp: datetime
 
 
 def create_system_status_event(
@@ -5,6 +5,12 @@ Main Dashboard Server - Launch point for the web dashboard
 import asyncio
 import uvicorn
 import logging
+
+try:
+    import uvloop
+except ImportError:  # uvloop is unavailable on Windows
+    uvloop = None
+
 from dashboard.backend.dashboard_api import app
 from dashboard.backend.websocket_handler import WebSocketManager
 
@@ -27,6 +33,11 @@ async def main():
         host="0.0.0.0",
         port=8000,
         log_level="info",
+        http="httptools",
+        ws="websockets",
+        backlog=4096,
+        timeout_keep_alive=75,
+        limit_concurrency=10000,
         reload=False,  # Set to True for development
         access_log=True
     )
@@ -38,7 +49,11 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        # server.serve() runs on the caller's loop, so pick uvloop here
+        if uvloop is not None:
+            uvloop.run(main())
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
         logger.info("Dashboard server stopped by user")
     except Exception as e:
@@ -3,18 +3,18 @@ Integration Testing Package
 End-to-end testing and system integration validation
 """
 
-from .e2e_testing import (
-    E2ETestRunner,
-    TestScenario,
-    TestResult,
-    SystemValidator,
-    PerformanceBenchmark
-)
-
 __all__ = [
     'E2ETestRunner',
     'TestScenario',
     'TestResult',
     'SystemValidator',
     'PerformanceBenchmark'
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Import the e2e testing module on first use of one of its exports (PEP 562)"""
+    if name in __all__:
+        from . import e2e_testing
+        return getattr(e2e_testing, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}") 
\ No newline at end of file
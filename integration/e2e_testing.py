@@ -5,27 +5,45 @@ Comprehensive testing of autonomous research workflows from hypothesis to public
 
 import asyncio
 import logging
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Awaitable, Callable, ClassVar, Deque, FrozenSet, Iterator, Mapping, Sequence, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from uuid import uuid4
 import json
+import sys
 import time
 
-from core.research_project import ResearchProject, ResearchState, Priority
+from core.research_project import ResearchProject, ResearchMetrics, ResearchState, Priority
 from core.orchestrator import ResearchOrchestrator
 from workflow.workflow_engine import WorkflowEngine, WorkflowState, AutomatedResearchCycle
 from workflow.task_scheduler import TaskScheduler, PriorityLevel
 from safety.oversight_monitor import SafetyMonitor, SafetyStatus
 from quality.peer_review_system import PeerReviewSystem, ReviewStatus
 from communication.protocols import CollaborationProtocol
-from communication.agent_registry import AgentRegistry
+from communication.agent_registry import AgentRegistry, RegistryEntry, RegistrationStatus
 from communication.message_bus import MessageBus
-from agents.agent_types import AgentType
+from agents.agent_types import AgentType, AGENT_DEFAULT_CAPABILITIES
 
 logger = logging.getLogger(__name__)
 
+# Oldest detailed log lines are dropped beyond this many per test
+MAX_DETAILED_LOGS = 10_000
+
+# Seconds between status polls for a cycle without a change event
+WORKFLOW_STATUS_FALLBACK_INTERVAL = 30
+
+# Scenario step handler: receives the running test's result, returns the step's output
+StepHandler = Callable[["TestResult"], Awaitable[Any]]
+
+# TestScenario fields holding step strings that are looked up in the dispatch tables
+STEP_FIELDS = ("setup_steps", "execution_steps", "validation_criteria")
+
+def _intern_keys(table: Dict[str, Any]) -> Dict[str, Any]:
+    """Return ``table`` keyed by interned strings so step lookups hit on identity"""
+    return {sys.intern(key): value for key, value in table.items()}
+
 class TestStatus(Enum):
     """Status of test execution"""
     PENDING = "pending"
@@ -46,7 +64,7 @@ class TestCategory(Enum):
     STRESS = "stress"
     FAILURE_RECOVERY = "failure_recovery"
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     """Result of a test execution"""
     test_id: str
@@ -59,25 +77,51 @@ class TestResult:
     success_metrics: Dict[str, bool] = field(default_factory=dict)
     performance_metrics: Dict[str, float] = field(default_factory=dict)
     error_message: Optional[str] = None
-    detailed_logs: List[str] = field(default_factory=list)
+    detailed_logs: Deque[str] = field(default_factory=lambda: deque(maxlen=MAX_DETAILED_LOGS))
     artifacts: Dict[str, Any] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class TestScenario:
     """Definition of a test scenario"""
     scenario_id: str
     scenario_name: str
     category: TestCategory
     description: str
-    setup_steps: List[str]
-    execution_steps: List[str]
-    validation_criteria: List[str]
+    setup_steps: Sequence[str]
+    execution_steps: Sequence[str]
+    validation_criteria: Sequence[str]
     expected_duration_minutes: int
     timeout_minutes: int
     prerequisites: List[str] = field(default_factory=list)
     cleanup_required: bool = True
+    fail_fast: bool = True  # stop validating at the first failed criterion
 
-@dataclass
+class _ScenarioRegistry(Mapping):
+    """Read-only mapping of scenario ID to TestScenario, building each on first access"""
+    
+    def __init__(self, specs: Dict[str, Dict[str, Any]]):
+        self._specs = specs
+        self._scenarios: Dict[str, TestScenario] = {}
+    
+    def __getitem__(self, scenario_id: str) -> TestScenario:
+        scenario = self._scenarios.get(scenario_id)
+        if scenario is None:
+            spec = dict(self._specs[scenario_id])
+            for name in STEP_FIELDS:
+                spec[name] = tuple(sys.intern(step) for step in spec[name])
+            scenario = self._scenarios[scenario_id] = TestScenario(**spec)
+        return scenario
+    
+    def __contains__(self, scenario_id: object) -> bool:
+        return scenario_id in self._specs
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._specs)
+    
+    def __len__(self) -> int:
+        return len(self._specs)
+
+@dataclass(slots=True)
 class PerformanceBenchmark:
     """Performance benchmark definition"""
     benchmark_id: str
@@ -90,9 +134,17 @@ class PerformanceBenchmark:
 class SystemValidator:
     """Validates system state and component interactions"""
     
+    # Seconds a system health snapshot is reused before probing again
+    HEALTH_TTL_SECONDS = 30
+    
     def __init__(self):
         self.validation_rules = {}
         self._initialize_validation_rules()
+        
+        # Last health snapshot and its time.monotonic() timestamp
+        self._health_cache: Optional[Dict[str, bool]] = None
+        self._health_cache_ts = 0.0
+        self._health_ttl = self.HEALTH_TTL_SECONDS
     
     def _initialize_validation_rules(self):
         """Initialize system validation rules"""
@@ -120,8 +172,20 @@ class SystemValidator:
             }
         }
     
+    def invalidate_health(self) -> None:
+        """Force the next health check to probe the system again"""
+        self._health_cache = None
+    
     async def validate_system_health(self) -> Dict[str, bool]:
-        """Validate overall system health"""
+        """Validate overall system health
+        
+        Repeated checks within the TTL share one snapshot; call
+        ``invalidate_health`` after disturbing the system to re-probe.
+        """
+        now = time.monotonic()
+        if self._health_cache is not None and now - self._health_cache_ts < self._health_ttl:
+            return self._health_cache
+        
         validations = {}
         
         # Component availability
@@ -139,6 +203,8 @@ class SystemValidator:
         validations["agents_available"] = True
         validations["communication_functional"] = True
         
+        self._health_cache = validations
+        self._health_cache_ts = now
         return validations
     
     async def validate_workflow_completion(self, cycle: AutomatedResearchCycle) -> Dict[str, bool]:
@@ -147,7 +213,7 @@ class SystemValidator:
         
         # State validation
         validations["workflow_completed"] = cycle.state == WorkflowState.COMPLETED
-        validations["all_steps_completed"] = all(step.is_completed for step in cycle.template.steps)
+        validations["all_steps_completed"] = cycle.completed_step_count == len(cycle.template.steps)
         validations["quality_threshold_met"] = cycle.quality_score >= 0.7
         
         # Results validation
@@ -170,247 +236,278 @@ class E2ETestRunner:
     from individual components to full research cycles
     """
     
-    def __init__(self):
-        # System components (to be injected)
-        self.orchestrator: Optional[ResearchOrchestrator] = None
-        self.workflow_engine: Optional[WorkflowEngine] = None
-        self.task_scheduler: Optional[TaskScheduler] = None
-        self.safety_monitor: Optional[SafetyMonitor] = None
-        self.quality_system: Optional[PeerReviewSystem] = None
-        self.collaboration_protocol: Optional[CollaborationProtocol] = None
-        self.agent_registry: Optional[AgentRegistry] = None
-        
-        # Test management
-        self.test_scenarios: Dict[str, TestScenario] = {}
-        self.test_results: Dict[str, TestResult] = {}
-        self.performance_benchmarks: Dict[str, PerformanceBenchmark] = {}
-        
-        # Test configuration
-        self.test_timeout_minutes = 60
-        self.max_concurrent_tests = 3
-        self.cleanup_between_tests = True
-        
-        # System validator
-        self.validator = SystemValidator()
-        
-        # Test statistics
-        self.test_stats = {
-            "total_tests_run": 0,
-            "tests_passed": 0,
-            "tests_failed": 0,
-            "average_test_duration_minutes": 0.0,
-            "system_uptime_percent": 0.0
-        }
-        
-        # Initialize test scenarios and benchmarks
-        self._initialize_test_scenarios()
-        self._initialize_performance_benchmarks()
+    # Setup steps that must finish before another setup step may start;
+    # steps not listed here have no ordering constraints
+    _SETUP_DEPENDENCIES: ClassVar[Dict[str, FrozenSet[str]]] = _intern_keys({
+        "Create test research project": frozenset({"Initialize system components"}),
+        "Register test agents": frozenset({"Initialize system components"}),
+    })
     
-    def inject_components(self, orchestrator: ResearchOrchestrator, 
-                         workflow_engine: WorkflowEngine,
-                         task_scheduler: TaskScheduler,
-                         safety_monitor: SafetyMonitor,
-                         quality_system: PeerReviewSystem,
-                         collaboration_protocol: CollaborationProtocol,
-                         agent_registry: AgentRegistry):
-        """Inject system components for testing"""
-        self.orchestrator = orchestrator
-        self.workflow_engine = workflow_engine
-        self.task_scheduler = task_scheduler
-        self.safety_monitor = safety_monitor
-        self.quality_system = quality_system
-        self.collaboration_protocol = collaboration_protocol
-        self.agent_registry = agent_registry
-    
-    def _initialize_test_scenarios(self):
-        """Initialize comprehensive test scenarios"""
-        
+    # Scenario definitions; TestScenario objects are only built when first used
+    _SCENARIO_SPECS: ClassVar[Dict[str, Dict[str, Any]]] = {
         # Basic workflow tests
-        self.test_scenarios["basic_research_cycle"] = TestScenario(
+        "basic_research_cycle": dict(
             scenario_id="basic_research_cycle",
             scenario_name="Basic Research Cycle End-to-End",
             category=TestCategory.BASIC_WORKFLOW,
             description="Test complete research cycle from project creation to completion",
-            setup_steps=[
+            setup_steps=(
                 "Initialize system components",
                 "Create test research project",
                 "Register test agents"
-            ],
-            execution_steps=[
+            ),
+            execution_steps=(
                 "Start automated research cycle",
                 "Monitor workflow progress",
                 "Validate step completions",
                 "Verify results generation"
-            ],
-            validation_criteria=[
+            ),
+            validation_criteria=(
                 "All workflow steps completed",
                 "Quality score >= 0.7",
                 "No safety violations",
                 "Results properly stored"
-            ],
+            ),
             expected_duration_minutes=15,
             timeout_minutes=30
-        )
+        ),
         
-        self.test_scenarios["agent_coordination"] = TestScenario(
+        "agent_coordination": dict(
             scenario_id="agent_coordination",
             scenario_name="Multi-Agent Coordination Test",
             category=TestCategory.BASIC_WORKFLOW,
             description="Test coordination between different agent types",
-            setup_steps=[
+            setup_steps=(
                 "Deploy theory, experimental, and analysis agents",
                 "Create collaboration workflow"
-            ],
-            execution_steps=[
+            ),
+            execution_steps=(
                 "Initiate multi-agent task",
                 "Monitor agent interactions", 
                 "Validate task handoffs",
                 "Verify collaborative results"
-            ],
-            validation_criteria=[
+            ),
+            validation_criteria=(
                 "All agents participated",
                 "Task handoffs successful",
                 "Collaborative results generated",
                 "Token rewards distributed"
-            ],
+            ),
             expected_duration_minutes=10,
             timeout_minutes=20
-        )
+        ),
         
         # Advanced workflow tests
-        self.test_scenarios["complex_research_pipeline"] = TestScenario(
+        "complex_research_pipeline": dict(
             scenario_id="complex_research_pipeline",
             scenario_name="Complex Research Pipeline",
             category=TestCategory.ADVANCED_WORKFLOW,
             description="Test complex research pipeline with dependencies and parallel processing",
-            setup_steps=[
+            setup_steps=(
                 "Set up multiple research projects",
                 "Configure complex workflow templates",
                 "Initialize resource pools"
-            ],
-            execution_steps=[
+            ),
+            execution_steps=(
                 "Launch multiple concurrent research cycles",
                 "Monitor resource allocation",
                 "Track workflow dependencies",
                 "Validate parallel processing"
-            ],
-            validation_criteria=[
+            ),
+            validation_criteria=(
                 "All projects completed successfully",
                 "Resource conflicts avoided",
                 "Dependencies properly managed",
                 "Parallel efficiency achieved"
-            ],
+            ),
             expected_duration_minutes=45,
             timeout_minutes=90
-        )
+        ),
         
         # Performance tests
-        self.test_scenarios["performance_stress"] = TestScenario(
+        "performance_stress": dict(
             scenario_id="performance_stress",
             scenario_name="System Performance Under Load",
             category=TestCategory.PERFORMANCE,
             description="Test system performance under high load conditions",
-            setup_steps=[
+            setup_steps=(
                 "Configure high-load test environment",
                 "Prepare performance monitoring",
                 "Set baseline measurements"
-            ],
-            execution_steps=[
+            ),
+            execution_steps=(
                 "Launch 10 concurrent research cycles",
                 "Monitor system resource usage",
                 "Measure response times",
                 "Track throughput metrics"
-            ],
-            validation_criteria=[
+            ),
+            validation_criteria=(
                 "Response times < 2 seconds",
                 "CPU usage < 80%",
                 "Memory usage < 75%",
                 "No system failures"
-            ],
+            ),
             expected_duration_minutes=30,
             timeout_minutes=60
-        )
+        ),
         
         # Safety tests
-        self.test_scenarios["safety_intervention"] = TestScenario(
+        "safety_intervention": dict(
             scenario_id="safety_intervention",
             scenario_name="Safety System Intervention",
             category=TestCategory.SAFETY,
             description="Test safety system response to violations",
-            setup_steps=[
+            setup_steps=(
                 "Enable safety monitoring",
                 "Configure safety thresholds",
                 "Prepare test violations"
-            ],
-            execution_steps=[
+            ),
+            execution_steps=(
                 "Trigger resource limit violation",
                 "Trigger time limit violation",
                 "Monitor safety system response",
                 "Validate intervention actions"
-            ],
-            validation_criteria=[
+            ),
+            validation_criteria=(
                 "Safety violations detected",
                 "Appropriate actions taken",
                 "System recovered safely",
                 "Emergency protocols functional"
-            ],
+            ),
             expected_duration_minutes=20,
-            timeout_minutes=40
-        )
+            timeout_minutes=40,
+            fail_fast=False  # report every criterion for diagnosis
+        ),
         
         # Quality assurance tests
-        self.test_scenarios["quality_assessment"] = TestScenario(
+        "quality_assessment": dict(
             scenario_id="quality_assessment",
             scenario_name="Automated Quality Assessment",
             category=TestCategory.QUALITY,
             description="Test automated peer review and quality assessment",
-            setup_steps=[
+            setup_steps=(
                 "Complete a research cycle",
                 "Initialize peer review system",
                 "Configure review criteria"
-            ],
-            execution_steps=[
+            ),
+            execution_steps=(
                 "Start automated peer review",
                 "Monitor review progress",
                 "Validate quality metrics",
                 "Check publication readiness"
-            ],
-            validation_criteria=[
+            ),
+            validation_criteria=(
                 "Quality assessment completed",
                 "Multiple review dimensions evaluated",
                 "Consistent reviewer consensus",
                 "Publication recommendation generated"
-            ],
+            ),
             expected_duration_minutes=25,
-            timeout_minutes=50
-        )
+            timeout_minutes=50,
+            fail_fast=False  # report every criterion for diagnosis
+        ),
         
         # Failure recovery tests
-        self.test_scenarios["failure_recovery"] = TestScenario(
+        "failure_recovery": dict(
             scenario_id="failure_recovery",
             scenario_name="System Failure Recovery",
             category=TestCategory.FAILURE_RECOVERY,
             description="Test system recovery from various failure scenarios",
-            setup_steps=[
+            setup_steps=(
                 "Start normal research cycle",
                 "Prepare failure injection",
                 "Set recovery monitoring"
-            ],
-            execution_steps=[
+            ),
+            execution_steps=(
                 "Inject agent failure",
                 "Inject network failure",
                 "Monitor recovery processes",
                 "Validate system restoration"
-            ],
-            validation_criteria=[
+            ),
+            validation_criteria=(
                 "Failures detected quickly",
                 "Recovery mechanisms activated",
                 "System restored to normal operation",
                 "Data integrity maintained"
-            ],
+            ),
             expected_duration_minutes=35,
             timeout_minutes=70
         )
+    }
+    
+    def __init__(self):
+        # System components (to be injected)
+        self.orchestrator: Optional[ResearchOrchestrator] = None
+        self.workflow_engine: Optional[WorkflowEngine] = None
+        self.task_scheduler: Optional[TaskScheduler] = None
+        self.safety_monitor: Optional[SafetyMonitor] = None
+        self.quality_system: Optional[PeerReviewSystem] = None
+        self.collaboration_protocol: Optional[CollaborationProtocol] = None
+        self.agent_registry: Optional[AgentRegistry] = None
+        
+        # Test management
+        self.test_scenarios: Mapping[str, TestScenario] = {}
+        self._scenario_ids_by_category: Dict[TestCategory, List[str]] = {}
+        self.test_results: Dict[str, TestResult] = {}
+        self.performance_benchmarks: Dict[str, PerformanceBenchmark] = {}
+        
+        # Test configuration
+        self.test_timeout_minutes = 60
+        self.max_concurrent_tests = 3
+        self.cleanup_between_tests = True
+        
+        # Bounds running scenarios across all categories
+        self._test_slots = asyncio.Semaphore(self.max_concurrent_tests)
+        
+        # Projects already registered with the orchestrator, reused across tests;
+        # leased ones go back to the pool on cleanup
+        self._project_pool: List[ResearchProject] = []
+        self._leased_projects: List[ResearchProject] = []
+        
+        # Report generation tasks still running after run_all_tests returned
+        self._pending_reports: Set[asyncio.Task] = set()
+        
+        # System validator
+        self.validator = SystemValidator()
+        
+        # Test statistics
+        self.test_stats = {
+            "total_tests_run": 0,
+            "tests_passed": 0,
+            "tests_failed": 0,
+            "average_test_duration_minutes": 0.0,
+            "system_uptime_percent": 0.0
+        }
+        self._total_test_minutes = 0.0  # running sum behind the average duration
+        
+        # Initialize test scenarios, benchmarks and step dispatch
+        self._initialize_test_scenarios()
+        self._initialize_performance_benchmarks()
+        self._initialize_step_handlers()
+    
+    def inject_components(self, orchestrator: ResearchOrchestrator, 
+                         workflow_engine: WorkflowEngine,
+                         task_scheduler: TaskScheduler,
+                         safety_monitor: SafetyMonitor,
+                         quality_system: PeerReviewSystem,
+                         collaboration_protocol: CollaborationProtocol,
+                         agent_registry: AgentRegistry):
+        """Inject system components for testing"""
+        self.orchestrator = orchestrator
+        self.workflow_engine = workflow_engine
+        self.task_scheduler = task_scheduler
+        self.safety_monitor = safety_monitor
+        self.quality_system = quality_system
+        self.collaboration_protocol = collaboration_protocol
+        self.agent_registry = agent_registry
+    
+    def _initialize_test_scenarios(self):
+        """Initialize comprehensive test scenarios"""
+        self.test_scenarios = _ScenarioRegistry(self._SCENARIO_SPECS)
+        
+        # Index scenario IDs by category from the specs, without building scenarios
+        for scenario_id, spec in self._SCENARIO_SPECS.items():
+            self._scenario_ids_by_category.setdefault(spec["category"], []).append(scenario_id)
         
         logger.info(f"Initialized {len(self.test_scenarios)} test scenarios")
     
@@ -465,71 +562,97 @@ class E2ETestRunner:
             logger.error("System health check failed, aborting tests")
             return {}
         
-        # Run tests by category
-        all_results = {}
-        
-        # Basic workflow tests
-        basic_results = await self._run_test_category(TestCategory.BASIC_WORKFLOW)
-        all_results.update(basic_results)
-        
-        # Advanced workflow tests
-        advanced_results = await self._run_test_category(TestCategory.ADVANCED_WORKFLOW)
-        all_results.update(advanced_results)
-        
-        # Performance tests
-        performance_results = await self._run_test_category(TestCategory.PERFORMANCE)
-        all_results.update(performance_results)
-        
-        # Safety tests
-        safety_results = await self._run_test_category(TestCategory.SAFETY)
-        all_results.update(safety_results)
+        # Register projects up front so scenarios do not pay for it one at a time
+        try:
+            await self._fill_project_pool(self.max_concurrent_tests * 4)
+        except Exception as e:
+            logger.warning(f"Could not pre-register test projects: {e}")
+        
+        # Categories are independent, so run them together; scenarios share one concurrency limit
+        categories = [
+            TestCategory.BASIC_WORKFLOW,
+            TestCategory.ADVANCED_WORKFLOW,
+            TestCategory.PERFORMANCE,
+            TestCategory.SAFETY,
+            TestCategory.QUALITY,
+            TestCategory.FAILURE_RECOVERY
+        ]
+        category_results = await asyncio.gather(
+            *(self._run_test_category(category, cleanup=False) for category in categories)
+        )
         
-        # Quality tests
-        quality_results = await self._run_test_category(TestCategory.QUALITY)
-        all_results.update(quality_results)
+        all_results = {}
+        for results in category_results:
+            all_results.update(results)
         
-        # Failure recovery tests
-        recovery_results = await self._run_test_category(TestCategory.FAILURE_RECOVERY)
-        all_results.update(recovery_results)
+        # Cleanup pauses every active cycle, so it runs once all categories have finished
+        if self.cleanup_between_tests:
+            try:
+                await self._cleanup_test_environment()
+            except Exception as e:
+                logger.error(f"Error cleaning up test environment: {e}")
         
-        # Generate test report
-        await self._generate_test_report(all_results)
+        # Generate the test report off the critical path; shutdown() waits for it
+        report_task = asyncio.create_task(self._generate_test_report(all_results))
+        self._pending_reports.add(report_task)
+        report_task.add_done_callback(self._pending_reports.discard)
         
         logger.info(f"Completed E2E test suite: {len(all_results)} tests executed")
         return all_results
     
-    async def _run_test_category(self, category: TestCategory) -> Dict[str, TestResult]:
-        """Run all tests in a specific category"""
-        category_scenarios = {k: v for k, v in self.test_scenarios.items() if v.category == category}
-        results = {}
+    async def _run_test_category(self, category: TestCategory, cleanup: bool = True) -> Dict[str, TestResult]:
+        """Run all tests in a specific category
+        
+        With ``cleanup`` the environment is cleaned once the category
+        finishes (if ``cleanup_between_tests`` is set); callers running
+        several categories at once clean up themselves.
+        """
+        category_scenarios = [
+            self.test_scenarios[scenario_id]
+            for scenario_id in self._scenario_ids_by_category.get(category, ())
+        ]
         
         logger.info(f"Running {len(category_scenarios)} tests in category {category.value}")
         
-        for scenario_id, scenario in category_scenarios.items():
-            try:
-                result = await self._run_test_scenario(scenario)
-                results[scenario_id] = result
-                
-                # Cleanup between tests if configured
-                if self.cleanup_between_tests:
-                    await self._cleanup_test_environment()
-                
-            except Exception as e:
-                logger.error(f"Error running test {scenario_id}: {e}")
-                result = TestResult(
+        # Scenarios are I/O-bound, so run up to max_concurrent_tests at once
+        async def run_guarded(scenario: TestScenario) -> TestResult:
+            async with self._test_slots:
+                return await self._run_test_scenario(scenario)
+        
+        outcomes = await asyncio.gather(
+            *(run_guarded(scenario) for scenario in category_scenarios),
+            return_exceptions=True
+        )
+        
+        results = {}
+        for scenario, outcome in zip(category_scenarios, outcomes):
+            scenario_id = scenario.scenario_id
+            if isinstance(outcome, BaseException):
+                logger.error(f"Error running test {scenario_id}: {outcome}")
+                outcome = TestResult(
                     test_id=scenario_id,
                     test_name=scenario.scenario_name,
                     category=category,
                     status=TestStatus.FAILED,
                     start_time=datetime.utcnow(),
-                    error_message=str(e)
+                    error_message=str(outcome)
                 )
-                results[scenario_id] = result
+            results[scenario_id] = outcome
+        
+        # Cleanup pauses every active cycle, so it waits until no test in the category is running
+        if cleanup and self.cleanup_between_tests:
+            try:
+                await self._cleanup_test_environment()
+            except Exception as e:
+                logger.error(f"Error cleaning up after category {category.value}: {e}")
         
         return results
     
     async def _run_test_scenario(self, scenario: TestScenario) -> TestResult:
         """Run a single test scenario"""
+        # Durations come from the loop's monotonic clock; wall time is only kept for start/end
+        loop = asyncio.get_running_loop()
+        start_mono = loop.time()
         test_result = TestResult(
             test_id=scenario.scenario_id,
             test_name=scenario.scenario_name,
@@ -541,14 +664,11 @@ class E2ETestRunner:
         logger.info(f"Starting test: {scenario.scenario_name}")
         
         try:
-            # Setup phase
-            await self._execute_test_setup(scenario, test_result)
-            
-            # Execution phase
-            await self._execute_test_steps(scenario, test_result)
-            
-            # Validation phase
-            await self._validate_test_results(scenario, test_result)
+            # A stuck scenario is cancelled so it releases its concurrency slot
+            await asyncio.wait_for(
+                self._run_scenario_phases(scenario, test_result),
+                timeout=scenario.timeout_minutes * 60
+            )
             
             # Determine final status
             if all(test_result.success_metrics.values()):
@@ -569,85 +689,128 @@ class E2ETestRunner:
             self.test_stats["tests_failed"] += 1
             
         finally:
-            test_result.end_time = datetime.utcnow()
-            test_result.duration_seconds = (test_result.end_time - test_result.start_time).total_seconds()
+            test_result.duration_seconds = loop.time() - start_mono
+            test_result.end_time = test_result.start_time + timedelta(seconds=test_result.duration_seconds)
             self.test_stats["total_tests_run"] += 1
             
-            # Update average duration
-            total_tests = self.test_stats["total_tests_run"]
-            current_avg = self.test_stats["average_test_duration_minutes"]
-            new_duration = test_result.duration_seconds / 60
-            self.test_stats["average_test_duration_minutes"] = (current_avg * (total_tests - 1) + new_duration) / total_tests
+            # Update average duration from the running sum
+            self._total_test_minutes += test_result.duration_seconds / 60
+            self.test_stats["average_test_duration_minutes"] = self._total_test_minutes / self.test_stats["total_tests_run"]
         
         logger.info(f"Test {scenario.scenario_name} completed with status: {test_result.status.value}")
         return test_result
     
+    async def _run_scenario_phases(self, scenario: TestScenario, test_result: TestResult) -> None:
+        """Run a scenario's setup, execution and validation phases in order"""
+        # Setup phase
+        await self._execute_test_setup(scenario, test_result)
+        
+        # Execution phase
+        await self._execute_test_steps(scenario, test_result)
+        
+        # Validation phase
+        await self._validate_test_results(scenario, test_result)
+    
+    def _initialize_step_handlers(self):
+        """Build dispatch tables mapping scenario step strings to their handlers
+        
+        Setup and execution entries are ``(handler, artifact_key)``; a
+        handler's return value is stored under ``artifact_key`` when set.
+        Validation handlers return whether the criterion passed.
+        """
+        self._setup_handlers: Dict[str, Tuple[StepHandler, Optional[str]]] = _intern_keys({
+            "Initialize system components": (lambda result: self._initialize_test_components(), None),
+            "Create test research project": (lambda result: self._create_test_project(), "test_project"),
+            "Register test agents": (lambda result: self._register_test_agents(), "test_agents"),
+            "Deploy theory, experimental, and analysis agents": (
+                lambda result: self._deploy_agent_types([AgentType.THEORY, AgentType.EXPERIMENTAL, AgentType.ANALYSIS]),
+                None
+            ),
+            "Enable safety monitoring": (lambda result: self._enable_safety_monitoring(), None),
+        })
+        
+        self._execution_handlers: Dict[str, Tuple[StepHandler, Optional[str]]] = _intern_keys({
+            "Start automated research cycle": (self._start_test_research_cycle, "cycle_id"),
+            "Monitor workflow progress": (self._monitor_workflow_progress, None),
+            "Initiate multi-agent task": (self._initiate_multi_agent_task, "task_id"),
+            "Launch multiple concurrent research cycles": (
+                lambda result: self._launch_concurrent_cycles(result, count=5), "concurrent_cycle_ids"
+            ),
+            "Launch 10 concurrent research cycles": (
+                lambda result: self._launch_concurrent_cycles(result, count=10), "stress_cycle_ids"
+            ),
+            "Start automated peer review": (self._start_test_peer_review, "review_id"),
+            "Trigger resource limit violation": (
+                lambda result: self._trigger_safety_violation(result, "resource_limit"), None
+            ),
+            "Inject agent failure": (self._inject_agent_failure, None),
+        })
+        
+        self._validation_handlers: Dict[str, StepHandler] = _intern_keys({
+            "All workflow steps completed": self._validate_workflow_completion,
+            "Quality score >= 0.7": lambda result: self._validate_quality_score(result, 0.7),
+            "No safety violations": self._validate_no_safety_violations,
+            "All agents participated": self._validate_agent_participation,
+            "Response times < 2 seconds": lambda result: self._validate_response_times(result, 2.0),
+            "Safety violations detected": self._validate_safety_violations_detected,
+            "Quality assessment completed": self._validate_quality_assessment,
+            "System restored to normal operation": self._validate_system_recovery,
+        })
+    
+    def _setup_waves(self, setup_steps: Sequence[str]) -> List[List[str]]:
+        """Group setup steps into waves whose members do not depend on each other
+        
+        A step lands one wave after the latest earlier step it depends on,
+        so independent steps share a wave while listed order is kept
+        within each wave.
+        """
+        levels: Dict[str, int] = {}
+        waves: List[List[str]] = []
+        for step in setup_steps:
+            depends_on = self._SETUP_DEPENDENCIES.get(step, frozenset())
+            level = max((levels[dep] + 1 for dep in depends_on if dep in levels), default=0)
+            levels[step] = level
+            if level == len(waves):
+                waves.append([])
+            waves[level].append(step)
+        return waves
+    
     async def _execute_test_setup(self, scenario: TestScenario, test_result: TestResult) -> None:
-        """Execute test setup steps"""
+        """Execute test setup steps, running independent steps concurrently"""
         test_result.detailed_logs.append("=== SETUP PHASE ===")
         
-        for step in scenario.setup_steps:
-            test_result.detailed_logs.append(f"Setup: {step}")
-            
-            if step == "Initialize system components":
-                await self._initialize_test_components()
-            elif step == "Create test research project":
-                project = await self._create_test_project()
-                test_result.artifacts["test_project"] = project
-            elif step == "Register test agents":
-                agents = await self._register_test_agents()
-                test_result.artifacts["test_agents"] = agents
-            elif step == "Deploy theory, experimental, and analysis agents":
-                await self._deploy_agent_types([AgentType.THEORY, AgentType.EXPERIMENTAL, AgentType.ANALYSIS])
-            elif step == "Enable safety monitoring":
-                if self.safety_monitor:
-                    await self.safety_monitor.start_monitoring()
-            # Add more setup steps as needed
+        for wave in self._setup_waves(scenario.setup_steps):
+            entries = []
+            for step in wave:
+                test_result.detailed_logs.append(f"Setup: {step}")
+                entry = self._setup_handlers.get(step)
+                if entry:
+                    entries.append(entry)
             
-            await asyncio.sleep(0.1)  # Small delay between setup steps
+            values = await asyncio.gather(*(handler(test_result) for handler, _ in entries))
+            for (_, artifact_key), value in zip(entries, values):
+                if artifact_key:
+                    test_result.artifacts[artifact_key] = value
     
     async def _execute_test_steps(self, scenario: TestScenario, test_result: TestResult) -> None:
         """Execute main test steps"""
         test_result.detailed_logs.append("=== EXECUTION PHASE ===")
+        loop = asyncio.get_running_loop()
         
         for step in scenario.execution_steps:
             test_result.detailed_logs.append(f"Executing: {step}")
-            start_time = time.time()
+            start_time = loop.time()
             
-            if step == "Start automated research cycle":
-                cycle_id = await self._start_test_research_cycle(test_result)
-                test_result.artifacts["cycle_id"] = cycle_id
-                
-            elif step == "Monitor workflow progress":
-                await self._monitor_workflow_progress(test_result)
-                
-            elif step == "Initiate multi-agent task":
-                task_id = await self._initiate_multi_agent_task(test_result)
-                test_result.artifacts["task_id"] = task_id
-                
-            elif step == "Launch multiple concurrent research cycles":
-                cycle_ids = await self._launch_concurrent_cycles(test_result, count=5)
-                test_result.artifacts["concurrent_cycle_ids"] = cycle_ids
-                
-            elif step == "Launch 10 concurrent research cycles":
-                cycle_ids = await self._launch_concurrent_cycles(test_result, count=10)
-                test_result.artifacts["stress_cycle_ids"] = cycle_ids
-                
-            elif step == "Start automated peer review":
-                review_id = await self._start_test_peer_review(test_result)
-                test_result.artifacts["review_id"] = review_id
-                
-            elif step == "Trigger resource limit violation":
-                await self._trigger_safety_violation(test_result, "resource_limit")
-                
-            elif step == "Inject agent failure":
-                await self._inject_agent_failure(test_result)
+            entry = self._execution_handlers.get(step)
+            if entry:
+                handler, artifact_key = entry
+                value = await handler(test_result)
+                if artifact_key:
+                    test_result.artifacts[artifact_key] = value
             
             # Record step execution time
-            step_duration = time.time() - start_time
+            step_duration = loop.time() - start_time
             test_result.performance_metrics[f"{step}_duration_seconds"] = step_duration
-            
-            await asyncio.sleep(0.5)  # Brief pause between steps
     
     async def _validate_test_results(self, scenario: TestScenario, test_result: TestResult) -> None:
         """Validate test results against criteria"""
@@ -656,31 +819,13 @@ class E2ETestRunner:
         for criteria in scenario.validation_criteria:
             test_result.detailed_logs.append(f"Validating: {criteria}")
             
-            if criteria == "All workflow steps completed":
-                test_result.success_metrics[criteria] = await self._validate_workflow_completion(test_result)
-                
-            elif criteria == "Quality score >= 0.7":
-                test_result.success_metrics[criteria] = await self._validate_quality_score(test_result, 0.7)
-                
-            elif criteria == "No safety violations":
-                test_result.success_metrics[criteria] = await self._validate_no_safety_violations(test_result)
-                
-            elif criteria == "All agents participated":
-                test_result.success_metrics[criteria] = await self._validate_agent_participation(test_result)
-                
-            elif criteria == "Response times < 2 seconds":
-                test_result.success_metrics[criteria] = await self._validate_response_times(test_result, 2.0)
-                
-            elif criteria == "Safety violations detected":
-                test_result.success_metrics[criteria] = await self._validate_safety_violations_detected(test_result)
-                
-            elif criteria == "Quality assessment completed":
-                test_result.success_metrics[criteria] = await self._validate_quality_assessment(test_result)
-                
-            elif criteria == "System restored to normal operation":
-                test_result.success_metrics[criteria] = await self._validate_system_recovery(test_result)
-            
-            # Add more validation criteria as needed
+            handler = self._validation_handlers.get(criteria)
+            if handler:
+                passed = await handler(test_result)
+                test_result.success_metrics[criteria] = passed
+                if not passed and scenario.fail_fast:
+                    test_result.detailed_logs.append(f"Stopping validation after failed criterion: {criteria}")
+                    break
     
     async def _initialize_test_components(self) -> None:
         """Initialize system components for testing"""
@@ -691,21 +836,57 @@ class E2ETestRunner:
     
     async def _create_test_project(self) -> ResearchProject:
         """Create a test research project"""
-        project = ResearchProject(
-            title="E2E Test Research Project",
-            research_question="How effective is the autonomous research system?",
-            hypothesis="The system can conduct research autonomously with high quality",
-            physics_domain="computational",
-            priority=Priority.HIGH,
-            expected_duration_hours=2,
-            max_cost_usd=100.0
-        )
-        
-        if self.orchestrator:
-            await self.orchestrator.add_project(project)
-        
+        (project,) = await self._acquire_projects(1)
+        project.title = "E2E Test Research Project"
+        project.research_question = "How effective is the autonomous research system?"
+        project.hypothesis = "The system can conduct research autonomously with high quality"
+        project.priority = Priority.HIGH
+        project.expected_duration_hours = 2
+        project.max_cost_usd = 100.0
         return project
     
+    async def _fill_project_pool(self, size: int) -> None:
+        """Register idle projects until the pool holds ``size`` of them"""
+        missing = size - len(self._project_pool)
+        if missing > 0:
+            self._project_pool.extend(await self._register_projects(missing))
+    
+    async def _register_projects(self, count: int) -> List[ResearchProject]:
+        """Create ``count`` projects and register them with the orchestrator concurrently"""
+        projects = [ResearchProject(physics_domain="computational") for _ in range(count)]
+        if self.orchestrator:
+            await asyncio.gather(*(self.orchestrator.add_project(project) for project in projects))
+        return projects
+    
+    async def _acquire_projects(self, count: int) -> List[ResearchProject]:
+        """Lease ``count`` reset projects, registering new ones only when the pool runs dry"""
+        taken = min(count, len(self._project_pool))
+        projects = self._project_pool[len(self._project_pool) - taken:]
+        del self._project_pool[len(self._project_pool) - taken:]
+        for project in projects:
+            self._reset_project(project)
+        projects.extend(await self._register_projects(count - taken))
+        
+        self._leased_projects.extend(projects)
+        return projects
+    
+    @staticmethod
+    def _reset_project(project: ResearchProject) -> None:
+        """Clear the state a previous test left on a pooled project"""
+        if project.state != ResearchState.INITIAL:
+            project.update_state(ResearchState.INITIAL, "Reset for reuse by another test")
+        project.started_at = None
+        project.completed_at = None
+        project.priority = Priority.MEDIUM
+        project.assigned_agents.clear()
+        project.primary_agent = None
+        project.results.clear()
+        project.datasets.clear()
+        project.publications.clear()
+        project.metrics = ResearchMetrics()
+        project.metadata.clear()
+        project.logs.clear()
+    
     async def _register_test_agents(self) -> List[str]:
         """Register test agents"""
         test_agents = [
@@ -716,9 +897,19 @@ class E2ETestRunner:
         
         agent_ids = []
         if self.agent_registry:
-            for agent in test_agents:
-                # Simulate agent registration
-                agent_ids.append(agent["id"])
+            entries = [
+                RegistryEntry(
+                    agent_id=agent["id"],
+                    agent_type=agent["type"],
+                    capabilities=list(AGENT_DEFAULT_CAPABILITIES.get(agent["type"], [])),
+                    status=RegistrationStatus.ACTIVE,
+                    endpoint=f"test://{agent['id']}"
+                )
+                for agent in test_agents
+            ]
+            # One bulk registration instead of a registry call per agent
+            if await self.agent_registry.register_agents(entries):
+                agent_ids = [agent["id"] for agent in test_agents]
         
         return agent_ids
     
@@ -728,6 +919,11 @@ class E2ETestRunner:
         for agent_type in agent_types:
             logger.info(f"Deployed {agent_type.value} agent for testing")
     
+    async def _enable_safety_monitoring(self) -> None:
+        """Start safety monitoring if a monitor is injected"""
+        if self.safety_monitor:
+            await self.safety_monitor.start_monitoring()
+    
     async def _start_test_research_cycle(self, test_result: TestResult) -> Optional[str]:
         """Start a test research cycle"""
         if not self.workflow_engine or "test_project" not in test_result.artifacts:
@@ -747,9 +943,12 @@ class E2ETestRunner:
             return
         
         cycle_id = test_result.artifacts["cycle_id"]
-        timeout = time.time() + 300  # 5 minute timeout
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + 300  # 5 minute timeout
         
-        while time.time() < timeout:
+        while True:
+            # Fetch the change event before reading status so no update slips between them
+            changed = self.workflow_engine.cycle_events.get(cycle_id)
             status = await self.workflow_engine.get_cycle_status(cycle_id)
             if not status:
                 break
@@ -760,7 +959,18 @@ class E2ETestRunner:
                 test_result.artifacts["final_cycle_status"] = status
                 break
             
-            await asyncio.sleep(5)
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            
+            # Wake on the next progress or state change; poll slowly if the cycle has no event
+            if changed is None:
+                await asyncio.sleep(min(WORKFLOW_STATUS_FALLBACK_INTERVAL, remaining))
+                continue
+            try:
+                await asyncio.wait_for(changed.wait(), remaining)
+            except asyncio.TimeoutError:
+                pass
     
     async def _initiate_multi_agent_task(self, test_result: TestResult) -> Optional[str]:
         """Initiate a multi-agent collaboration task"""
@@ -784,21 +994,24 @@ class E2ETestRunner:
         if not self.workflow_engine:
             return []
         
-        cycle_ids = []
-        for i in range(count):
-            project = ResearchProject(
-                title=f"Concurrent Test Project {i+1}",
-                research_question=f"Test question {i+1}",
-                physics_domain="computational",
-                priority=Priority.MEDIUM
-            )
-            
-            if self.orchestrator:
-                await self.orchestrator.add_project(project)
-                
-            cycle_id = await self.workflow_engine.start_automated_cycle(project, "quick_validation")
-            if cycle_id:
-                cycle_ids.append(cycle_id)
+        try:
+            projects = await self._acquire_projects(count)
+        except Exception as e:
+            test_result.detailed_logs.append(f"Failed to register concurrent test projects: {e}")
+            return []
+        for i, project in enumerate(projects):
+            project.title = f"Concurrent Test Project {i+1}"
+            project.research_question = f"Test question {i+1}"
+        
+        # Start every cycle concurrently rather than one round trip at a time
+        launched = await asyncio.gather(
+            *(self.workflow_engine.start_automated_cycle(project, "quick_validation") for project in projects),
+            return_exceptions=True
+        )
+        cycle_ids = [cycle_id for cycle_id in launched if isinstance(cycle_id, str)]
+        for error in launched:
+            if isinstance(error, Exception):
+                test_result.detailed_logs.append(f"Failed to launch concurrent cycle: {error}")
         
         test_result.detailed_logs.append(f"Launched {len(cycle_ids)} concurrent cycles")
         return cycle_ids
@@ -839,6 +1052,9 @@ class E2ETestRunner:
         # Simulate agent failure
         test_result.detailed_logs.append("Injected agent failure")
         test_result.artifacts["agent_failure_injected"] = True
+        
+        # Health observed before the failure no longer applies
+        self.validator.invalidate_health()
     
     async def _validate_workflow_completion(self, test_result: TestResult) -> bool:
         """Validate that workflow completed successfully"""
@@ -889,15 +1105,12 @@ class E2ETestRunner:
         if not review_id or not self.quality_system:
             return False
         
-        # Wait for review completion
-        timeout = time.time() + 60  # 1 minute timeout
-        while time.time() < timeout:
-            status = await self.quality_system.get_review_status(review_id)
-            if status and status.get("status") == "completed":
-                return True
-            await asyncio.sleep(2)
+        # Wait for the review to finish (1 minute timeout), then check how it ended
+        if not await self.quality_system.wait_for_review(review_id, timeout=60):
+            return False
         
-        return False
+        status = await self.quality_system.get_review_status(review_id)
+        return bool(status) and status.get("status") == "completed"
     
     async def _validate_system_recovery(self, test_result: TestResult) -> bool:
         """Validate system recovered from failures"""
@@ -910,38 +1123,59 @@ class E2ETestRunner:
         # Clean up test artifacts
         logger.info("Cleaning up test environment")
         
-        # Stop any running cycles
+        # Stop any running cycles; only their IDs are needed, not full status reports
         if self.workflow_engine:
-            active_cycles = await self.workflow_engine.get_all_active_cycles()
-            for cycle in active_cycles:
-                await self.workflow_engine.pause_cycle(cycle["cycle_id"], "Test cleanup")
+            for cycle_id in list(self.workflow_engine.active_cycles):
+                await self.workflow_engine.pause_cycle(cycle_id, "Test cleanup")
+        
+        # Paused cycles no longer drive their projects, so they can be reused
+        self._project_pool.extend(self._leased_projects)
+        self._leased_projects.clear()
         
         # Reset safety monitor
         if self.safety_monitor:
             # Clear any test violations
             pass
+    
+    @staticmethod
+    def _step_duration_stats(results: Dict[str, TestResult]) -> Dict[str, float]:
+        """Summarize every recorded step duration across the suite in one array"""
+        # Imported here so importing the integration package does not load numpy
+        import numpy as np
+        
+        durations = np.fromiter(
+            (
+                value
+                for result in results.values()
+                for key, value in result.performance_metrics.items()
+                if key.endswith("_duration_seconds")
+            ),
+            dtype=np.float64,
+        )
+        if durations.size == 0:
+            return {}
         
-        await asyncio.sleep(2)  # Brief pause for cleanup
+        p50, p95, p99 = np.percentile(durations, [50, 95, 99])
+        return {
+            "step_count": int(durations.size),
+            "mean_seconds": float(durations.mean()),
+            "p50_seconds": float(p50),
+            "p95_seconds": float(p95),
+            "p99_seconds": float(p99),
+            "max_seconds": float(durations.max()),
+        }
     
     async def _generate_test_report(self, results: Dict[str, TestResult]) -> None:
         """Generate comprehensive test report"""
-        report = {
-            "test_execution_summary": {
-                "total_tests": len(results),
-                "passed": len([r for r in results.values() if r.status == TestStatus.PASSED]),
-                "failed": len([r for r in results.values() if r.status == TestStatus.FAILED]),
-                "timeout": len([r for r in results.values() if r.status == TestStatus.TIMEOUT]),
-                "success_rate": len([r for r in results.values() if r.status == TestStatus.PASSED]) / len(results) * 100
-            },
-            "performance_summary": {
-                "average_test_duration_minutes": sum(r.duration_seconds for r in results.values()) / len(results) / 60,
-                "total_execution_time_minutes": sum(r.duration_seconds for r in results.values()) / 60
-            },
-            "test_results": []
-        }
-        
+        # One pass over the results collects the counts, total duration and per-test rows
+        status_counts = {TestStatus.PASSED: 0, TestStatus.FAILED: 0, TestStatus.TIMEOUT: 0}
+        total_duration_seconds = 0.0
+        test_rows = []
         for test_id, result in results.items():
-            report["test_results"].append({
+            if result.status in status_counts:
+                status_counts[result.status] += 1
+            total_duration_seconds += result.duration_seconds
+            test_rows.append({
                 "test_id": test_id,
                 "test_name": result.test_name,
                 "category": result.category.value,
@@ -952,6 +1186,23 @@ class E2ETestRunner:
                 "error_message": result.error_message
             })
         
+        total_tests = len(results)
+        report = {
+            "test_execution_summary": {
+                "total_tests": total_tests,
+                "passed": status_counts[TestStatus.PASSED],
+                "failed": status_counts[TestStatus.FAILED],
+                "timeout": status_counts[TestStatus.TIMEOUT],
+                "success_rate": status_counts[TestStatus.PASSED] / total_tests * 100 if total_tests else 0.0
+            },
+            "performance_summary": {
+                "average_test_duration_minutes": total_duration_seconds / total_tests / 60 if total_tests else 0.0,
+                "total_execution_time_minutes": total_duration_seconds / 60,
+                "step_durations": self._step_duration_stats(results)
+            },
+            "test_results": test_rows
+        }
+        
         # Save report
         timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
         report_content = json.dumps(report, indent=2)
@@ -975,4 +1226,11 @@ class E2ETestRunner:
                 "safety_monitor": self.safety_monitor is not None,
                 "quality_system": self.quality_system is not None
             }
-        } 
\ No newline at end of file
+        }
+    
+    async def shutdown(self) -> None:
+        """Wait for test reports still being generated"""
+        results = await asyncio.gather(*self._pending_reports, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error generating test report: {result}")
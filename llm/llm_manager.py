@@ -5,7 +5,7 @@ Coordinates multiple LLM providers with intelligent routing and fallback
 
 import logging
 import asyncio
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Awaitable, Callable, Tuple
 from enum import Enum
 
 from .llm_interface import LLMProvider, LLMResponse, LLMMessage, ModelCapability
@@ -51,6 +51,16 @@ class LLMManager:
             "simple_text": ("openai", "gpt-3.5-turbo")
         }
         
+        # Routing resolved against the registered providers; rebuilt by _refresh_routing
+        self._resolved_routing: Dict[str, Tuple[str, str]] = {}
+        self._best_provider: Optional[str] = None
+        
+        # Seconds between launching successive hedged fallback requests
+        self.fallback_hedge_delay = 0.5
+        
+        # In-flight deterministic generations keyed by (provider, model, prompt, max_tokens)
+        self._inflight_generations: Dict[Tuple[str, str, str, int], asyncio.Task] = {}
+        
         # Usage tracking
         self.total_requests = 0
         self.total_cost = 0.0
@@ -59,22 +69,29 @@ class LLMManager:
     async def initialize(self, openai_api_key: str = None, anthropic_api_key: str = None) -> None:
         """Initialize all available providers"""
         try:
+            new_providers: Dict[str, LLMProvider] = {}
+            
             # Initialize OpenAI if API key provided
             if openai_api_key:
-                openai_provider = OpenAIProvider(openai_api_key)
-                await openai_provider.initialize()
-                self.providers["openai"] = openai_provider
-                self.provider_usage["openai"] = {"requests": 0, "cost": 0.0}
-                logger.info("OpenAI provider initialized")
+                new_providers["openai"] = OpenAIProvider(openai_api_key)
             
             # Initialize Anthropic if API key provided
             if anthropic_api_key:
                 # We'll add this in a future iteration
                 logger.info("Anthropic provider not yet implemented")
             
+            # Providers initialize independently, so their setup I/O overlaps
+            await asyncio.gather(*(provider.initialize() for provider in new_providers.values()))
+            for provider_name, provider in new_providers.items():
+                self.providers[provider_name] = provider
+                self.provider_usage[provider_name] = {"requests": 0, "cost": 0.0}
+                logger.info(f"{provider_name} provider initialized")
+            
             if not self.providers:
                 raise LLMIntegrationError("No LLM providers available")
             
+            self._refresh_routing()
+            
             self.is_initialized = True
             logger.info(f"LLM Manager initialized with {len(self.providers)} providers")
             
@@ -97,6 +114,33 @@ class LLMManager:
         # Get optimal provider and model
         provider_name, model = self._get_optimal_provider_and_model(task_type, complexity)
         
+        # Sampled generations must stay independent; only deterministic ones are shared
+        if temperature != 0:
+            return await self._generate_routed(prompt, agent_type, provider_name, model, max_tokens, temperature)
+        
+        # Identical deterministic requests already in flight share one provider call
+        key = (provider_name, model, prompt, max_tokens)
+        request = self._inflight_generations.get(key)
+        if request is None:
+            request = asyncio.create_task(
+                self._generate_routed(prompt, agent_type, provider_name, model, max_tokens, temperature)
+            )
+            self._inflight_generations[key] = request
+            request.add_done_callback(lambda _: self._inflight_generations.pop(key, None))
+        
+        # Shielded so one cancelled caller does not cancel the request for the others
+        return await asyncio.shield(request)
+    
+    async def _generate_routed(
+        self,
+        prompt: str,
+        agent_type: str,
+        provider_name: str,
+        model: str,
+        max_tokens: int,
+        temperature: float
+    ) -> LLMResponse:
+        """Generate with the routed provider and model, falling back on failure"""
         try:
             provider = self.providers[provider_name]
             response = await provider.generate(
@@ -192,24 +236,28 @@ class LLMManager:
     
     async def test_all_providers(self) -> Dict[str, bool]:
         """Test connectivity to all providers"""
+        outcomes = await asyncio.gather(
+            *(provider.test_connection() for provider in self.providers.values()),
+            return_exceptions=True
+        )
+        
         results = {}
-        for provider_name, provider in self.providers.items():
-            try:
-                results[provider_name] = await provider.test_connection()
-            except Exception as e:
-                logger.error(f"Provider {provider_name} test failed: {e}")
+        for provider_name, outcome in zip(self.providers, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Provider {provider_name} test failed: {outcome}")
                 results[provider_name] = False
+            else:
+                results[provider_name] = outcome
         return results
     
     # Private helper methods
     def _get_optimal_provider_and_model(self, task_type: str, complexity: TaskComplexity) -> tuple[str, str]:
         """Get the best provider and model for a task"""
         
-        # Check if we have a specific routing rule
-        if task_type in self.task_routing:
-            provider_name, model = self.task_routing[task_type]
-            if provider_name in self.providers:
-                return provider_name, model
+        # Check if we have a specific routing rule for an available provider
+        route = self._resolved_routing.get(task_type)
+        if route is not None:
+            return route
         
         # Fallback to best available provider
         best_provider = self._get_best_available_provider()
@@ -224,45 +272,85 @@ class LLMManager:
     
     def _get_best_available_provider(self) -> str:
         """Get the highest priority available provider"""
-        available_providers = [
-            (name, self.provider_priority.get(name, 0))
-            for name in self.providers.keys()
-        ]
-        
-        if not available_providers:
+        if self._best_provider is None:
             raise LLMIntegrationError("No providers available")
-        
-        # Sort by priority (highest first)
-        available_providers.sort(key=lambda x: x[1], reverse=True)
-        return available_providers[0][0]
+        return self._best_provider
+    
+    def _refresh_routing(self) -> None:
+        """Resolve task routes and the preferred provider; call whenever providers change"""
+        self._resolved_routing = {
+            task_type: route for task_type, route in self.task_routing.items()
+            if route[0] in self.providers
+        }
+        self._best_provider = max(
+            self.providers, key=lambda name: self.provider_priority.get(name, 0), default=None
+        )
     
     async def _try_fallback(self, prompt: str, failed_provider: str, max_tokens: int, temperature: float) -> Optional[LLMResponse]:
         """Try fallback providers if primary fails"""
-        for provider_name, provider in self.providers.items():
-            if provider_name != failed_provider:
-                try:
-                    logger.info(f"Trying fallback provider: {provider_name}")
-                    response = await provider.generate(prompt, max_tokens=max_tokens, temperature=temperature)
-                    self._update_usage_stats(provider_name, response)
-                    return response
-                except Exception as e:
-                    logger.warning(f"Fallback provider {provider_name} also failed: {e}")
-                    continue
-        return None
+        return await self._race_fallback(
+            failed_provider,
+            lambda provider: provider.generate(prompt, max_tokens=max_tokens, temperature=temperature),
+            "Fallback"
+        )
     
     async def _try_chat_fallback(self, messages: List[LLMMessage], failed_provider: str, max_tokens: int, temperature: float) -> Optional[LLMResponse]:
         """Try fallback providers for chat if primary fails"""
-        for provider_name, provider in self.providers.items():
-            if provider_name != failed_provider:
+        return await self._race_fallback(
+            failed_provider,
+            lambda provider: provider.chat(messages, max_tokens=max_tokens, temperature=temperature),
+            "Chat fallback"
+        )
+    
+    async def _race_fallback(
+        self,
+        failed_provider: str,
+        request: Callable[[LLMProvider], Awaitable[LLMResponse]],
+        label: str
+    ) -> Optional[LLMResponse]:
+        """Hedge a request across the remaining providers and return the first good answer
+        
+        Providers are launched ``fallback_hedge_delay`` seconds apart, so a
+        fast fallback usually answers before the next one is billed; slow or
+        hung ones no longer hold up the rest. The first successful response
+        wins and outstanding requests are cancelled. If none succeed, the
+        first response that did not raise is returned.
+        """
+        candidates = [
+            (provider_name, provider) for provider_name, provider in self.providers.items()
+            if provider_name != failed_provider
+        ]
+        
+        async def attempt(index: int, provider_name: str, provider: LLMProvider) -> LLMResponse:
+            await asyncio.sleep(index * self.fallback_hedge_delay)
+            logger.info(f"Trying {label.lower()} provider: {provider_name}")
+            try:
+                response = await request(provider)
+            except Exception as e:
+                logger.warning(f"{label} provider {provider_name} also failed: {e}")
+                raise
+            self._update_usage_stats(provider_name, response)
+            return response
+        
+        tasks = [
+            asyncio.create_task(attempt(index, provider_name, provider))
+            for index, (provider_name, provider) in enumerate(candidates)
+        ]
+        fallback_response = None
+        try:
+            for next_done in asyncio.as_completed(tasks):
                 try:
-                    logger.info(f"Trying chat fallback provider: {provider_name}")
-                    response = await provider.chat(messages, max_tokens=max_tokens, temperature=temperature)
-                    self._update_usage_stats(provider_name, response)
-                    return response
-                except Exception as e:
-                    logger.warning(f"Chat fallback provider {provider_name} also failed: {e}")
+                    response = await next_done
+                except Exception:
                     continue
-        return None
+                if response.success:
+                    return response
+                if fallback_response is None:
+                    fallback_response = response
+            return fallback_response
+        finally:
+            for task in tasks:
+                task.cancel()
     
     def _update_usage_stats(self, provider_name: str, response: LLMResponse) -> None:
         """Update usage statistics"""
@@ -128,6 +128,9 @@ class PeerReviewSystem:
         self.completed_reviews: Dict[str, AutomatedReview] = {}
         self.review_criteria: Dict[str, ReviewCriteria] = {}
         
+        # Set once a review finishes, whether completed or rejected
+        self._review_finished: Dict[str, asyncio.Event] = {}
+        
         # Quality thresholds
         self.quality_thresholds = {
             "publication_ready": 75.0,
@@ -292,6 +295,7 @@ class PeerReviewSystem:
             review.review_criteria_used = await self._select_review_criteria(target_type, review_data)
             
             self.active_reviews[review_id] = review
+            self._review_finished[review_id] = asyncio.Event()
             
             # Start the review process
             asyncio.create_task(self._conduct_review(review))
@@ -384,6 +388,12 @@ class PeerReviewSystem:
             logger.error(f"Error conducting review {review.review_id}: {e}")
             review.status = ReviewStatus.REJECTED
             review.completed_at = datetime.utcnow()
+        
+        finally:
+            # Waiters already hold the event; later ones check completed_at instead
+            finished = self._review_finished.pop(review.review_id, None)
+            if finished is not None:
+                finished.set()
     
     async def _conduct_individual_assessments(self, review: AutomatedReview) -> Dict[str, Dict[str, float]]:
         """Conduct individual reviewer assessments"""
@@ -793,6 +803,19 @@ class PeerReviewSystem:
             "minor_issues": review.minor_issues
         }
     
+    async def wait_for_review(self, review_id: str, timeout: float) -> bool:
+        """Wait until a review finishes; returns False on timeout or unknown review"""
+        finished = self._review_finished.get(review_id)
+        if finished is None:
+            review = self.completed_reviews.get(review_id) or self.active_reviews.get(review_id)
+            return review is not None and review.completed_at is not None
+        
+        try:
+            await asyncio.wait_for(finished.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+    
     async def get_review_details(self, review_id: str) -> Optional[Dict[str, Any]]:
         """Get detailed review information including comments"""
         review = self.active_reviews.get(review_id) or self.completed_reviews.get(review_id)
@@ -279,6 +279,7 @@ async def test_complete_research_workflow():
         await task_scheduler.stop()
         await safety_monitor.stop_monitoring()
         await message_bus.shutdown()
+        await e2e_runner.shutdown()
         
         logger.info("✅ Cleanup completed")
         
@@ -0,0 +1,91 @@
+"""
+LLM manager tests using stand-in providers; no API keys needed
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from llm.llm_interface import LLMResponse
+from llm.llm_manager import LLMManager
+
+
+class StandInProvider:
+    """Provider answering after a fixed delay, optionally unsuccessfully or by raising"""
+
+    def __init__(self, delay=0.0, success=True, raises=False):
+        self.delay = delay
+        self.success = success
+        self.raises = raises
+        self.calls = 0
+        self.cancelled = False
+
+    async def generate(self, prompt, **kwargs):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.raises:
+            raise RuntimeError("provider unavailable")
+        return LLMResponse(content=prompt, success=self.success, model_used="stand-in", provider="stand-in")
+
+
+@pytest.mark.asyncio
+async def test_fallback_hedge_skips_hung_provider():
+    """A hung fallback no longer holds up the next one, and losers are cancelled"""
+    manager = LLMManager()
+    manager.fallback_hedge_delay = 0.05
+    hung = StandInProvider(delay=10.0)
+    fast = StandInProvider(delay=0.01)
+    never_started = StandInProvider()
+    manager.providers = {"primary": StandInProvider(), "hung": hung, "fast": fast, "late": never_started}
+
+    started = time.perf_counter()
+    response = await manager._try_fallback("question", "primary", 10, 0.5)
+    elapsed = time.perf_counter() - started
+
+    assert response.success
+    assert elapsed < 1.0
+    assert manager.providers["primary"].calls == 0
+    assert hung.calls == fast.calls == 1
+    await asyncio.sleep(0)
+    assert hung.cancelled
+    # The third candidate was due after two hedge delays, by which time the race was over
+    assert never_started.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_fallback_returns_first_unsuccessful_response_when_none_succeed():
+    """Without a success, the first response that did not raise is returned, else None"""
+    manager = LLMManager()
+    manager.fallback_hedge_delay = 0.0
+    manager.providers = {"raises": StandInProvider(raises=True), "fails": StandInProvider(delay=0.01, success=False)}
+
+    response = await manager._try_fallback("question", "primary", 10, 0.5)
+    assert response is not None and not response.success
+
+    manager.providers = {"raises": StandInProvider(raises=True)}
+    assert await manager._try_fallback("question", "primary", 10, 0.5) is None
+
+
+@pytest.mark.asyncio
+async def test_identical_deterministic_requests_share_one_call():
+    """Concurrent temperature-0 requests share a provider call; sampled ones do not"""
+    provider = StandInProvider(delay=0.05)
+    manager = LLMManager()
+    manager.providers = {"openai": provider}
+    manager.is_initialized = True
+    manager._refresh_routing()
+
+    responses = await asyncio.gather(*(
+        manager.generate_for_agent("same prompt", "theory", temperature=0) for _ in range(8)
+    ))
+    assert provider.calls == 1
+    assert {response.content for response in responses} == {"same prompt"}
+    assert manager._inflight_generations == {}
+
+    await asyncio.gather(*(manager.generate_for_agent("same prompt", "theory") for _ in range(3)))
+    assert provider.calls == 4
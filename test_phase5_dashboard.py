@@ -0,0 +1,569 @@
+"""
+Dashboard backend tests using stand-in objects; no Redis or server needed
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import orjson
+import pytest
+from fastapi import BackgroundTasks
+
+from core.orchestrator import ResearchOrchestrator
+from core.research_project import ResearchState
+from dashboard.backend import dashboard_api
+from dashboard.backend.broadcast_relay import RedisBroadcastRelay
+from dashboard.backend.component_table import ComponentTable
+from dashboard.backend.cors import StaticCORSMiddleware
+from dashboard.backend.dashboard_api import (
+    _advance_workflow, _complete_workflow, _wants_zlib_payloads, send_metrics_snapshot
+)
+from dashboard.backend.dashboard_state import DashboardState
+from dashboard.backend.etag import StateETagMiddleware
+from dashboard.backend.metrics_collector import _LinuxProcReader
+from dashboard.backend.test_runner import DashboardTestRunner
+from dashboard.backend.websocket_handler import WebSocketManager
+from dashboard.backend.workflow_store import WorkflowStore
+from dashboard.shared.schemas import ComponentStatus, WorkflowStartRequest
+
+
+async def call_asgi(app, scope):
+    """Run an ASGI app for one request and return the messages it sent"""
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    await app(scope, receive, send)
+    return sent
+
+
+def http_scope(app_state, path="/api/dashboard/workflows", method="GET", headers=()):
+    """Minimal HTTP scope for calling middleware directly"""
+    return {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "headers": list(headers),
+        "app": SimpleNamespace(state=app_state),
+    }
+
+
+async def ok_endpoint(scope, receive, send):
+    """Stand-in endpoint answering 200 with a fixed body"""
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+async def connect_listening_client(manager, client_id, topics=()):
+    """Connect a client whose outbox collects payloads instead of feeding a socket writer"""
+    await manager.connect_client(client_id, {"topics": list(topics)})
+    outbox = asyncio.Queue()
+    manager.connected_clients[client_id]["outbox"] = outbox
+    return outbox
+
+
+def drain(outbox):
+    """Decoded payloads currently queued on a client outbox"""
+    payloads = []
+    while not outbox.empty():
+        payloads.append(orjson.loads(outbox.get_nowait()))
+    return payloads
+
+
+class StandInPubSub:
+    """In-memory stand-in for a Redis pub/sub subscription"""
+
+    def __init__(self):
+        self.items = asyncio.Queue()
+
+    async def listen(self):
+        while True:
+            yield await self.items.get()
+
+    async def aclose(self):
+        pass
+
+
+class StandInRedis:
+    """In-memory stand-in for the Redis client, shared by relays like one server"""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.published = []
+        self.subscribers = []
+
+    async def publish(self, channel, frame):
+        if self.fail:
+            raise ConnectionError("Redis went away")
+        self.published.append((channel, frame))
+        for pubsub in self.subscribers:
+            pubsub.items.put_nowait({"type": "message", "data": frame})
+
+    def subscribe(self):
+        pubsub = StandInPubSub()
+        self.subscribers.append(pubsub)
+        return pubsub
+
+
+@pytest.mark.asyncio
+async def test_etag_changes_on_direct_project_state_change():
+    """Projects changed outside the orchestrator must not be served as 304"""
+    orchestrator = ResearchOrchestrator()
+    project = await orchestrator.create_project("ETag project", "Does the tag move?")
+
+    dashboard = DashboardState()
+    dashboard.orchestrator = orchestrator
+    app = StateETagMiddleware(ok_endpoint, ["/api/dashboard/workflows"])
+    app_state = SimpleNamespace(dashboard=dashboard)
+
+    first = await call_asgi(app, http_scope(app_state))
+    etag = dict(first[0]["headers"])[b"etag"]
+
+    # Unchanged state answers the conditional request with 304
+    cached = await call_asgi(app, http_scope(app_state, headers=[(b"if-none-match", etag)]))
+    assert cached[0]["status"] == 304
+
+    # The workflow engine and safety monitor call update_state directly
+    project.update_state(ResearchState.FAILED, "Changed outside the orchestrator")
+
+    fresh = await call_asgi(app, http_scope(app_state, headers=[(b"if-none-match", etag)]))
+    assert fresh[0]["status"] == 200
+    assert dict(fresh[0]["headers"])[b"etag"] != etag
+    assert orchestrator.get_system_status()["projects"]["active"] == len(orchestrator.get_active_projects())
+
+
+def test_test_progress_prefers_results_over_phase_words():
+    """Result lines estimate from finished tests even when the test ID contains a phase word"""
+    runner = DashboardTestRunner(websocket_manager=None)
+
+    assert runner._parse_test_progress("run", b"======= test session starts =======", 0) == 5.0
+    assert runner._parse_test_progress("run", b"collecting ... ", 0) == 15.0
+    assert runner._parse_test_progress("run", b"collected 12 items", 0) == 25.0
+
+    # 1 finished test estimates against a 10-test floor: 1 / 10 * 90
+    line = b"tests/test_x.py::test_collected_items PASSED"
+    assert runner._parse_test_progress("run", line, 1) == 9.0
+    line = b"tests/test_x.py::test_session_starts_cleanly FAILED"
+    assert runner._parse_test_progress("run", line, 1) == 9.0
+
+    # Lines without markers keep the last reported progress
+    runner.running_tests["run"] = {"progress": 42.0}
+    assert runner._parse_test_progress("run", b"some other output", 3) == 42.0
+
+
+@pytest.mark.asyncio
+async def test_websocket_subscriptions_are_bounded():
+    """Client-chosen topics are validated and capped, and stale group state is dropped"""
+    manager = WebSocketManager()
+    await manager.connect_client("client", {"topics": ["t%d" % i for i in range(500)]})
+    assert len(manager.connected_clients["client"]["subs"]) == manager.MAX_CLIENT_TOPICS
+
+    await manager.connect_client("other", {"topics": ["metrics"]})
+    await manager.subscribe("other", "workflows")  # a bare string is not a topic list
+    await manager.subscribe("other", ["x" * (manager.MAX_TOPIC_LENGTH + 1), "", 7, "workflows"])
+    assert manager.connected_clients["other"]["subs"] == frozenset({"metrics", "workflows"})
+
+    # Churning through distinct subscription sets must not leave one entry per set behind
+    for i in range(50):
+        await manager.subscribe("other", ["churn%d" % i])
+        await manager.deliver_batch([((), {"type": "ping"})])
+    assert len(manager._group_activity) <= len(manager._client_groups())
+
+    clients = await manager.get_connected_clients()
+    assert clients["other"]["last_activity"] >= clients["other"]["connected_at"]
+
+
+@pytest.mark.asyncio
+async def test_etag_passes_other_requests_through():
+    """Only GETs on the polled paths are tagged; everything else reaches the app untouched"""
+    dashboard = DashboardState()
+    app = StateETagMiddleware(ok_endpoint, ["/api/dashboard/workflows"])
+    app_state = SimpleNamespace(dashboard=dashboard)
+
+    tagged = await call_asgi(app, http_scope(app_state))
+    other_path = await call_asgi(app, http_scope(app_state, path="/api/dashboard/status"))
+    post = await call_asgi(app, http_scope(app_state, method="POST"))
+    assert dict(tagged[0]["headers"])[b"etag"] == dashboard.etag().encode("latin-1")
+    assert other_path[0]["headers"] == []
+    assert post[0]["headers"] == []
+
+
+@pytest.mark.asyncio
+async def test_cors_preflight_and_simple_requests():
+    """Allowed origins are echoed back; preflights never reach the application"""
+    app = StaticCORSMiddleware(ok_endpoint, ["http://localhost:3000"])
+    allowed = (b"origin", b"http://localhost:3000")
+    preflight = [allowed, (b"access-control-request-method", b"POST"),
+                 (b"access-control-request-headers", b"content-type")]
+
+    ok = await call_asgi(app, http_scope(None, method="OPTIONS", headers=preflight))
+    denied = await call_asgi(app, http_scope(
+        None, method="OPTIONS",
+        headers=[(b"origin", b"http://evil.example"), preflight[1]]
+    ))
+    simple = await call_asgi(app, http_scope(None, headers=[allowed]))
+    foreign = await call_asgi(app, http_scope(None, headers=[(b"origin", b"http://evil.example")]))
+    no_origin = await call_asgi(app, http_scope(None))
+
+    assert ok[0]["status"] == 204
+    headers = dict(ok[0]["headers"])
+    assert headers[b"access-control-allow-origin"] == b"http://localhost:3000"
+    assert headers[b"access-control-allow-headers"] == b"content-type"
+    assert headers[b"access-control-allow-methods"] == StaticCORSMiddleware.METHODS
+
+    assert denied[0]["status"] == 400
+
+    assert simple[0]["status"] == 200
+    headers = dict(simple[0]["headers"])
+    assert headers[b"access-control-allow-origin"] == b"http://localhost:3000"
+    assert headers[b"access-control-allow-credentials"] == b"true"
+
+    assert foreign[0]["headers"] == []
+    assert no_origin[0]["headers"] == []
+
+
+def test_component_table_slots_and_payload():
+    """Components keep their slot when re-added, and every payload change bumps the version"""
+    table = ComponentTable()
+    assert table.add("orchestrator") == 0
+    assert table.add("safety_monitor", ComponentStatus.WARNING, error_count=2) == 1
+    assert len(table) == 2
+
+    version = table.version
+    table.set_status("orchestrator", ComponentStatus.ERROR)
+    assert table.version > version
+
+    # Re-adding resets the component in place
+    assert table.add("safety_monitor", ComponentStatus.HEALTHY) == 1
+    assert len(table) == 2
+
+    table.touch_all(42.0)
+    assert list(table.heartbeats) == [42.0, 42.0]
+    assert table.to_payload() == {
+        "orchestrator": {"status": "error", "error_count": 0, "performance_score": 100.0},
+        "safety_monitor": {"status": "healthy", "error_count": 0, "performance_score": 100.0},
+    }
+
+
+def test_component_table_tracks_overall_health():
+    """Severity counts follow every status write, including re-adds of known components"""
+    table = ComponentTable()
+    assert table.overall_health == ComponentStatus.HEALTHY
+
+    table.add("orchestrator")
+    table.add("safety_monitor")
+    assert table.overall_health == ComponentStatus.HEALTHY
+
+    table.set_status("orchestrator", ComponentStatus.WARNING)
+    assert table.overall_health == ComponentStatus.WARNING
+
+    table.set_status("safety_monitor", ComponentStatus.OFFLINE)
+    assert table.overall_health == ComponentStatus.ERROR
+
+    # Re-adding resets the component and must release its old severity
+    table.add("safety_monitor", ComponentStatus.HEALTHY)
+    assert table.overall_health == ComponentStatus.WARNING
+
+    table.set_status("orchestrator", ComponentStatus.HEALTHY)
+    assert table.overall_health == ComponentStatus.HEALTHY
+    assert table.severity_counts == [2, 0, 0]
+
+
+def test_workflow_store_evicts_finished_workflows():
+    """Finished workflows are capped and expire; live ones are never evicted"""
+    store = WorkflowStore(max_finished=2, ttl_seconds=3600.0)
+    for i in range(4):
+        store.add("cycle%d" % i, {"status": "running"})
+    store.add("live", {"status": "running"})
+
+    for i in range(4):
+        store.set_status("cycle%d" % i, "completed", progress=100.0)
+
+    # Only the two most recently finished workflows are retained
+    assert "cycle0" not in store and "cycle1" not in store
+    assert store.is_finished("cycle2") and store.is_finished("cycle3")
+    assert store["cycle3"]["progress"] == 100.0
+    assert "live" in store and store.live_count() == 1
+    assert len(store) == 3
+
+    # Past the TTL every finished workflow goes on the next prune
+    store.ttl_seconds = -1.0
+    store.add("another", {"status": "running"})
+    assert "cycle2" not in store and "cycle3" not in store
+    assert len(store) == store.live_count() == 2
+
+
+def test_linux_proc_reader_parses_counters():
+    """CPU, memory and network figures are parsed from /proc formatted text"""
+    files = {
+        "/proc/stat": b"cpu  100 0 50 800 50 0 0 0 0 0\ncpu0 100 0 50 800 50 0 0 0 0 0\n",
+        "/proc/meminfo": (
+            b"MemTotal:        1000 kB\n"
+            b"MemFree:          100 kB\n"
+            b"MemAvailable:     250 kB\n"
+        ),
+        "/proc/net/dev": (
+            b"Inter-|   Receive                            |  Transmit\n"
+            b" face |bytes    packets errs drop fifo frame compressed multicast|bytes    packets\n"
+            b"    lo:    1000      10    0    0    0     0          0         0     1000      10"
+            b"    0    0    0     0       0          0\n"
+            b"  eth0:    5000      20    0    0    0     0          0         0     2500      15"
+            b"    0    0    0     0       0          0\n"
+        ),
+    }
+
+    # Skip opening the real files; _read is the only source the parsers use
+    reader = _LinuxProcReader.__new__(_LinuxProcReader)
+    reader._fds = {}
+    reader._read = files.__getitem__
+    reader._last_cpu = reader._cpu_times()
+    assert reader._last_cpu == (150, 1000)
+
+    # 100 more jiffies, 30 of them busy
+    files["/proc/stat"] = b"cpu  120 0 60 860 60 0 0 0 0 0\n"
+    assert reader.read_cpu() == 30.0
+    assert reader.read_cpu() == 0.0
+
+    memory = reader.read_memory()
+    assert memory.total == 1000 * 1024
+    assert memory.used == 750 * 1024
+    assert memory.percent == 75.0
+
+    network = reader.read_network()
+    assert network.bytes_recv == 6000
+    assert network.bytes_sent == 3500
+
+
+@pytest.mark.asyncio
+async def test_outbox_coalesces_superseded_progress():
+    """One drain sends only the latest progress event per workflow and test run"""
+    manager = WebSocketManager()
+    outbox = await connect_listening_client(manager, "client")
+
+    for progress in (10.0, 20.0, 30.0):
+        manager.enqueue({"type": "workflow_progress_update", "data": {"cycle_id": "a", "progress": progress}})
+    manager.enqueue({"type": "workflow_progress_update", "data": {"cycle_id": "b", "progress": 5.0}})
+    manager.enqueue({"type": "test_progress_update", "data": {"test_id": "t", "progress": 1.0}})
+    manager.enqueue({"type": "test_progress_update", "data": {"test_id": "t", "progress": 2.0}})
+    manager.enqueue({"type": "log", "data": {"line": 1}})
+    manager.enqueue({"type": "log", "data": {"line": 2}})
+    await manager._flush_outbox()
+
+    (frame,) = drain(outbox)
+    assert frame["type"] == "multi"
+    messages = [(message["type"], message["data"]) for message in frame["payload"]]
+    assert messages == [
+        ("workflow_progress_update", {"cycle_id": "a", "progress": 30.0}),
+        ("workflow_progress_update", {"cycle_id": "b", "progress": 5.0}),
+        ("test_progress_update", {"test_id": "t", "progress": 2.0}),
+        ("log", {"line": 1}),
+        ("log", {"line": 2}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_relay_publishes_only_shared_topics():
+    """Worker-local topics such as metrics are never published to other workers"""
+    relay = RedisBroadcastRelay()
+    relay.redis = StandInRedis()
+
+    await relay.publish([(("metrics",), {"type": "metrics_update"})])
+    assert relay.redis.published == []
+
+    await relay.publish([
+        (("metrics",), {"type": "metrics_update"}),
+        (("workflows",), {"type": "workflow_started"}),
+        ((), {"type": "announcement"}),
+    ])
+    (channel, frame), = relay.redis.published
+    assert channel == RedisBroadcastRelay.CHANNEL
+    envelope = orjson.loads(frame)
+    assert envelope["origin"] == relay.worker_id
+    assert [message["type"] for _, message in envelope["batch"]] == ["workflow_started", "announcement"]
+
+
+@pytest.mark.asyncio
+async def test_relay_delivers_between_workers():
+    """A batch drained on one worker reaches the other worker's clients exactly once"""
+    server = StandInRedis()
+    workers = []
+    for _ in range(2):
+        manager = WebSocketManager()
+        relay = RedisBroadcastRelay()
+        relay.redis = server
+        relay._listen_task = asyncio.create_task(relay._listen(server.subscribe(), manager))
+        manager.relay = relay
+        outbox = await connect_listening_client(manager, "client", ["workflows"])
+        workers.append((manager, relay, outbox))
+
+    (first, first_relay, first_outbox), (second, second_relay, second_outbox) = workers
+    first.publish("workflows", {"type": "workflow_started"})
+    first.publish("metrics", {"type": "metrics_update"})
+    await first._flush_outbox()
+    await asyncio.sleep(0.01)
+
+    assert [frame["type"] for frame in drain(first_outbox)] == ["workflow_started"]
+    # The origin skips its own frame, so nothing is delivered twice
+    assert [frame["type"] for frame in drain(second_outbox)] == ["workflow_started"]
+    await asyncio.sleep(0.01)
+    assert drain(first_outbox) == []
+
+    for _, relay, _ in workers:
+        relay.redis = None
+        await relay.stop()
+
+
+@pytest.mark.asyncio
+async def test_relay_failure_keeps_broadcasts_local():
+    """Without a reachable Redis, broadcasts still reach the worker's own clients"""
+    relay = RedisBroadcastRelay("redis://127.0.0.1:1")
+    manager = WebSocketManager()
+    with pytest.raises(Exception):
+        await relay.start(manager)
+    await relay.stop()
+    assert relay.redis is None
+
+    # A relay that fails mid-run logs the error and local delivery carries on
+    relay.redis = StandInRedis(fail=True)
+    manager.relay = relay
+    outbox = await connect_listening_client(manager, "client")
+    manager.publish("workflows", {"type": "workflow_started"})
+    await manager._flush_outbox()
+    assert [frame["type"] for frame in drain(outbox)] == ["workflow_started"]
+
+
+def test_workflow_timers_ignore_evicted_records():
+    """Step and completion timers firing after eviction are no-ops rather than KeyErrors"""
+    dashboard = DashboardState()
+    dashboard.active_workflows = WorkflowStore(max_finished=0)
+    dashboard.active_workflows.add("cycle", {"status": "running"})
+    dashboard.active_workflows.set_status("cycle", "stopped")
+    assert "cycle" not in dashboard.active_workflows
+
+    _advance_workflow(dashboard, "cycle", "hypothesis_generation", 30.0)
+    _complete_workflow(dashboard, "cycle")
+    assert "cycle" not in dashboard.active_workflows
+
+
+@pytest.mark.asyncio
+async def test_new_metrics_subscribers_get_a_full_snapshot():
+    """Metrics that never cross their change threshold still reach late subscribers"""
+    dashboard = DashboardState()
+    dashboard.websocket_manager = WebSocketManager()
+    dashboard.component_table.add("orchestrator")
+
+    # Nothing collected yet: no snapshot to send
+    outbox = await connect_listening_client(dashboard.websocket_manager, "early", ["metrics"])
+    await send_metrics_snapshot(dashboard, "early")
+    assert drain(outbox) == []
+
+    dashboard.system_metrics.update({"cpu_usage": 12.5, "disk_usage": 40.0, "total_agents": 3, "untracked": 1})
+    outbox = await connect_listening_client(dashboard.websocket_manager, "late", ["metrics"])
+    await send_metrics_snapshot(dashboard, "late")
+    (snapshot,) = drain(outbox)
+    assert snapshot["data"]["performance"] == {"cpu_usage": 12.5, "disk_usage": 40.0, "total_agents": 3}
+    assert snapshot["data"]["components"]["orchestrator"]["status"] == "healthy"
+
+    # Clients not receiving the metrics topic are left alone
+    outbox = await connect_listening_client(dashboard.websocket_manager, "workflows_only", ["workflows"])
+    await send_metrics_snapshot(dashboard, "workflows_only")
+    assert drain(outbox) == []
+
+
+class SteadyMetricsCollector:
+    """Stand-in collector whose readings drift below every change threshold"""
+
+    def __init__(self):
+        self.ticks = 0
+
+    async def collect_metrics(self):
+        self.ticks += 1
+        return {"cpu_usage": 10.0 + 0.01 * self.ticks, "disk_usage": 40.0}
+
+
+@pytest.mark.asyncio
+async def test_steady_metrics_keep_the_etag(monkeypatch):
+    """Ticks that broadcast nothing leave the state version, and so the ETag, alone"""
+    monkeypatch.setattr(dashboard_api, "METRICS_BASE_INTERVAL", 0.01)
+    monkeypatch.setattr(dashboard_api, "METRICS_MAX_INTERVAL", 0.01)
+    dashboard = DashboardState()
+    dashboard.websocket_manager = WebSocketManager()
+    dashboard.metrics_collector = SteadyMetricsCollector()
+
+    task = asyncio.create_task(dashboard_api.periodic_metrics_collection(dashboard))
+    while dashboard.metrics_collector.ticks < 1:
+        await asyncio.sleep(0.005)
+    etag = dashboard.etag()
+    while dashboard.metrics_collector.ticks < 5:
+        await asyncio.sleep(0.005)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert dashboard.etag() == etag
+    assert dashboard.system_metrics["cpu_usage"] > 10.01
+
+
+@pytest.mark.asyncio
+async def test_lifespan_stops_metrics_before_cleanup(monkeypatch):
+    """The metrics task is finished before the collector's executor and /proc files close"""
+    monkeypatch.setattr(dashboard_api, "METRICS_BASE_INTERVAL", 0.01)
+    monkeypatch.setattr(dashboard_api, "METRICS_MAX_INTERVAL", 0.01)
+    ticks_at_cleanup = []
+
+    async def initialize(state):
+        state.websocket_manager = WebSocketManager()
+        state.metrics_collector = SteadyMetricsCollector()
+
+    async def cleanup(state):
+        ticks_at_cleanup.append(state.metrics_collector.ticks)
+
+    monkeypatch.setattr(dashboard_api, "initialize_dashboard_components", initialize)
+    monkeypatch.setattr(dashboard_api, "cleanup_dashboard_components", cleanup)
+
+    app = SimpleNamespace(state=SimpleNamespace())
+    async with dashboard_api.lifespan(app):
+        await asyncio.sleep(0.05)
+    collector = app.state.dashboard.metrics_collector
+
+    # No tick runs once cleanup has started
+    await asyncio.sleep(0.05)
+    assert ticks_at_cleanup == [collector.ticks]
+    assert collector.ticks > 0
+
+
+def test_zlib_payloads_skip_permessage_deflate_clients():
+    """Clients already getting permessage-deflate frames are not compressed a second time"""
+    def socket(query, extensions=None):
+        headers = {"sec-websocket-extensions": extensions} if extensions else {}
+        return SimpleNamespace(query_params=query, headers=headers)
+
+    assert _wants_zlib_payloads(socket({"compress": "1"}))
+    assert not _wants_zlib_payloads(socket({}))
+    assert not _wants_zlib_payloads(socket({"compress": "1"}, "permessage-deflate; client_max_window_bits"))
+
+
+@pytest.mark.asyncio
+async def test_mock_workflows_run_their_simulated_steps(monkeypatch):
+    """Without an orchestrator, started workflows advance through every step and complete"""
+    monkeypatch.setattr(dashboard_api, "WORKFLOW_STEP_SECONDS", 0.001)
+    dashboard = DashboardState()
+    background_tasks = BackgroundTasks()
+
+    response = await dashboard_api.start_workflow(
+        WorkflowStartRequest(project_name="Mock", research_topic="Does it move?"),
+        background_tasks,
+        dashboard
+    )
+    cycle_id = response["data"]["cycle_id"]
+    await background_tasks()
+    await asyncio.sleep(0.05)
+
+    workflow = dashboard.active_workflows[cycle_id]
+    assert workflow["status"] == "completed"
+    assert workflow["progress"] == 100.0
+    assert dashboard.active_workflows.is_finished(cycle_id)
@@ -75,6 +75,7 @@ class AutomatedResearchCycle:
     progress_percentage: float = 0.0
     assigned_agents: Dict[str, str] = field(default_factory=dict)  # step_id -> agent_id
     step_results: Dict[str, Any] = field(default_factory=dict)
+    completed_step_count: int = 0  # steps of the template marked completed
     safety_status: str = "safe"
     quality_score: float = 0.0
     intervention_required: bool = False
@@ -96,6 +97,9 @@ class WorkflowEngine:
         
         # Active workflows
         self.active_cycles: Dict[str, AutomatedResearchCycle] = {}
+        
+        # Per-cycle change notification, set (and replaced) on progress and terminal states
+        self.cycle_events: Dict[str, asyncio.Event] = {}
         self.workflow_templates: Dict[str, ResearchWorkflowTemplate] = {}
         
         # Execution settings
@@ -314,6 +318,7 @@ class WorkflowEngine:
             )
             
             self.active_cycles[cycle_id] = cycle
+            self.cycle_events[cycle_id] = asyncio.Event()
             
             # Start the execution
             asyncio.create_task(self._execute_research_cycle(cycle))
@@ -391,6 +396,8 @@ class WorkflowEngine:
     async def _execute_workflow_steps(self, cycle: AutomatedResearchCycle) -> bool:
         """Execute all workflow steps in the correct order"""
         try:
+            # Every step runs again on resume, so the count restarts with them
+            cycle.completed_step_count = 0
             for i, step in enumerate(cycle.template.steps):
                 cycle.current_step_index = i
                 
@@ -407,6 +414,7 @@ class WorkflowEngine:
                 
                 # Update progress
                 cycle.progress_percentage = ((i + 1) / len(cycle.template.steps)) * 100
+                self._notify_cycle_change(cycle)
                 await self._trigger_event("step_completed", {"cycle": cycle, "step": step})
             
             return True
@@ -447,6 +455,7 @@ class WorkflowEngine:
             if success:
                 step.is_completed = True
                 step.completed_at = datetime.utcnow()
+                cycle.completed_step_count += 1
                 
                 # Store results
                 workflow_status = await self.collaboration_protocol.get_workflow_status(workflow_id)
@@ -552,7 +561,7 @@ class WorkflowEngine:
         """Check if a specific success criteria is met"""
         # Simplified criteria checking - in real implementation would be more sophisticated
         criteria_checks = {
-            "All steps completed successfully": all(step.is_completed for step in cycle.template.steps),
+            "All steps completed successfully": cycle.completed_step_count == len(cycle.template.steps),
             "Quality score >= 0.7": cycle.quality_score >= 0.7,
             "Peer review approval": cycle.step_results.get("peer_review", {}).get("approval", False),
             "Safety validation passed": cycle.step_results.get("safety_validation", {}).get("approval_status", "") == "approved",
@@ -579,6 +588,7 @@ class WorkflowEngine:
                 "cycle_duration": (cycle.completed_at - cycle.started_at).total_seconds() / 3600
             })
         
+        self._notify_cycle_change(cycle)
         await self._trigger_event("cycle_completed", cycle)
         logger.info(f"Successfully completed research cycle {cycle.cycle_id}")
     
@@ -592,9 +602,22 @@ class WorkflowEngine:
         if project:
             project.update_state(ResearchState.FAILED, f"Automated cycle failed: {reason}")
         
+        self._notify_cycle_change(cycle)
         await self._trigger_event("cycle_failed", {"cycle": cycle, "reason": reason})
         logger.error(f"Research cycle {cycle.cycle_id} failed: {reason}")
     
+    def _notify_cycle_change(self, cycle: AutomatedResearchCycle) -> None:
+        """Wake everything waiting on the cycle's current change event
+        
+        The set event is swapped for a fresh one, so a waiter that fetches
+        ``cycle_events[cycle_id]`` before reading the cycle's status never
+        misses the next change.
+        """
+        event = self.cycle_events.get(cycle.cycle_id)
+        if event is not None:
+            event.set()
+            self.cycle_events[cycle.cycle_id] = asyncio.Event()
+    
     async def _trigger_event(self, event_type: str, data: Any) -> None:
         """Trigger event handlers"""
         handlers = self.event_handlers.get(event_type, [])
@@ -643,6 +666,7 @@ class WorkflowEngine:
             return False
         
         cycle.state = WorkflowState.PAUSED
+        self._notify_cycle_change(cycle)
         logger.info(f"Paused research cycle {cycle_id}: {reason}")
         return True
     
@@ -677,4 +701,5 @@ class WorkflowEngine:
         
         for cycle_id in to_remove:
             del self.active_cycles[cycle_id]
+            self.cycle_events.pop(cycle_id, None)
             logger.info(f"Cleaned up completed cycle {cycle_id}") 
\ No newline at end of file